@@ -0,0 +1,208 @@
+# 자산 명세 열 분리 / 정리 (col_divide_ye, col_divide_ch, col_divide_hap, col_divide_re 통합)
+# 행 단위 iterrows 대신 Series.str.extractall 로 한 번에 항목을 나누고 금액은 열 단위로 계산
+# 명세 한 개 단위 파싱 규칙/패턴은 ow.parsing 과 공유
+# 사용법: python col_divide.py ye 입력.csv 출력.csv  (단계: ye, ch, hap, re)
+
+import argparse
+import os
+import sys
+
+import pandas as pd
+
+if not __package__: # python col_divide.py 로 실행하면 저장소 루트(ow 패키지)가 import 경로에 없음
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ow.parsing import (
+    CHANGE_FRAGMENT_PATTERN,
+    ITEM_SEQUENCE_PATTERN,
+    PARSABLE_NAME_PATTERN,
+    PARSABLE_SPACING_PATTERN,
+    POLITICAL_FUND_NAME_PATTERN,
+    parse_detail,
+)
+
+ASSET_TYPE_COLUMN_NAME = '자산구분'
+DETAIL_COLUMN_NAME = '소재지 면적 등 권리의 명세'
+
+COL_PREVIOUS_VALUE = '종전가액'
+COL_INCREASE_VALUE = '증가액'
+COL_DECREASE_VALUE = '감소액'
+COL_CURRENT_VALUE = '현재가액'
+AMOUNT_COLUMNS = [COL_PREVIOUS_VALUE, COL_INCREASE_VALUE, COL_DECREASE_VALUE, COL_CURRENT_VALUE]
+REQUIRED_COLUMNS = [ASSET_TYPE_COLUMN_NAME, DETAIL_COLUMN_NAME, *AMOUNT_COLUMNS]
+
+ASSET_TYPE_DEPOSIT = '예금'
+ASSET_TYPE_DEBT = '채무'
+ASSET_TYPE_POLITICAL_FUND = '정치자금법에 따른 정치자금의 수입 및 지출을 위한 예금계좌의 예금'
+ASSET_TYPE_PARTNERSHIP_SHARE = '합명·합자·유한회사 출자지분'
+
+
+def as_text(values): # 결측값은 '', 나머지는 str() 값 (object dtype 이라 pyarrow 가 아닌 파이썬 re 로 처리)
+    return values.astype(str).astype(object).where(values.notna(), '')
+
+
+def clean_values(values): # clean_value 의 열 단위 버전 (실수 1000.0 처럼 정수로 못 읽는 값은 기존처럼 0)
+    text = as_text(values).str.replace(',', '', regex=False).str.strip()
+    valid = text.str.fullmatch(r'[+-]?[0-9]+').astype(bool)
+    return pd.to_numeric(text.where(valid, '0')).astype('int64')
+
+
+def parse_details(details):
+    """
+    명세 Series -> 항목 DataFrame (row: details 의 index, 명세, 금액 4개).
+    한 행에 항목이 여러 개면 여러 줄, 순서는 문자열 안의 순서.
+    """
+    text = as_text(details)
+    blank = text.str.strip().eq('')
+    # '.' 은 줄바꿈과 맞지 않아서 extractall 이 줄을 건너뛰어 버림 -> 줄바꿈이 있는 명세만 순차 파서로
+    multiline = ~blank & text.str.contains('\n', regex=False).astype(bool)
+    simple = text[~blank & ~multiline]
+
+    matches = simple.str.extractall(ITEM_SEQUENCE_PATTERN)
+    current = clean_values(matches[1])
+    change = clean_values(matches[2])
+    change_type = matches[3].fillna('').str.replace(r'\s+', '', regex=True)
+    increase = change.where(change_type.eq('증가'), 0)
+    decrease = change.where(change_type.eq('감소'), 0)
+    frames = [pd.DataFrame({
+        'row': matches.index.get_level_values(0),
+        'order': matches.index.get_level_values(1),
+        DETAIL_COLUMN_NAME: matches[0].str.strip(' ,').to_numpy(),
+        COL_PREVIOUS_VALUE: (current - increase + decrease).to_numpy(),
+        COL_INCREASE_VALUE: increase.to_numpy(),
+        COL_DECREASE_VALUE: decrease.to_numpy(),
+        COL_CURRENT_VALUE: current.to_numpy(),
+    })]
+
+    # 마지막 항목 뒤에 남은 글자 (항목이 하나도 없으면 전체)
+    rest = simple.str.replace(ITEM_SEQUENCE_PATTERN, '', regex=True).str.strip(' ,')
+    matched = simple.index.isin(matches.index.get_level_values(0))
+    fragment = rest.str.fullmatch(CHANGE_FRAGMENT_PATTERN).astype(bool)
+    rest = rest[~matched | (rest.ne('') & ~fragment)]
+    match_counts = matches.index.get_level_values(0).value_counts()
+    frames.append(pd.DataFrame({
+        'row': rest.index,
+        'order': match_counts.reindex(rest.index, fill_value=0).to_numpy(),
+        DETAIL_COLUMN_NAME: rest.to_numpy(),
+    }))
+
+    frames.append(pd.DataFrame({'row': text.index[blank], 'order': 0, DETAIL_COLUMN_NAME: None}))
+    for index, value in text[multiline].items():
+        items = pd.DataFrame(parse_detail(value), columns=[DETAIL_COLUMN_NAME, *AMOUNT_COLUMNS])
+        frames.append(items.assign(row=index, order=range(len(items))))
+
+    items = pd.concat([frame for frame in frames if len(frame)], ignore_index=True)
+    items = items.reindex(columns=['row', 'order', DETAIL_COLUMN_NAME, *AMOUNT_COLUMNS]) # 금액 항목이 하나도 없을 때도 금액 열
+    items[AMOUNT_COLUMNS] = items[AMOUNT_COLUMNS].fillna(0).astype('int64')
+    items = items.sort_values(['row', 'order'], kind='stable')
+    return items.drop(columns='order').reset_index(drop=True)
+
+
+def clean_amounts(df): # 금액 열 4개를 정수로 정리한 사본
+    df = df.copy()
+    for column in AMOUNT_COLUMNS:
+        df[column] = clean_values(df[column])
+    return df
+
+
+def expand_rows(df, mask):
+    """mask 인 행은 명세 항목마다 한 행씩 (나머지 열은 복사), 나머지 행은 금액만 정리. 행 순서 유지"""
+    df = df.reset_index(drop=True)
+    mask = pd.Series(mask, index=df.index).astype(bool)
+    result = clean_amounts(df[~mask])
+    if not mask.any():
+        return result
+
+    items = parse_details(df.loc[mask, DETAIL_COLUMN_NAME])
+    expanded = df.loc[items['row']] # 항목 수만큼 원래 행을 반복 (explode)
+    expanded = expanded.assign(**{
+        column: items[column].to_numpy() for column in [DETAIL_COLUMN_NAME, *AMOUNT_COLUMNS]
+    })
+    result = pd.concat([result, expanded]).sort_index(kind='stable')
+    return result.reset_index(drop=True)
+
+
+def political_fund_names(details): # '국민은행 1,000' -> '국민은행' (extract_name_for_political_fund)
+    text = as_text(details).str.strip()
+    groups = text.str.extract(POLITICAL_FUND_NAME_PATTERN)
+    names = groups[0].where(groups[0].notna() & groups[0].ne(''), groups[1])
+    return names.str.strip(' ,').where(text.ne(''), None)
+
+
+def names_before_first_comma(details): # 첫 쉼표 앞부분 (extract_name_before_first_comma)
+    text = as_text(details)
+    names = text.str.split(',', n=1).str[0].str.strip()
+    return names.where(text.str.strip().ne(''), None)
+
+
+def replace_details(df, mask, extract): # mask 인 행의 명세를 extract 결과로 바꿈
+    df = df.copy()
+    if mask.any():
+        df[DETAIL_COLUMN_NAME] = df[DETAIL_COLUMN_NAME].astype(object)
+        df.loc[mask, DETAIL_COLUMN_NAME] = extract(df.loc[mask, DETAIL_COLUMN_NAME])
+    return df
+
+
+def is_parsable_details(details): # 이름 뒤에 금액/괄호가 붙어 있어서 나눌 수 있는 명세 (is_parsable_detail_string)
+    text = as_text(details)
+    return (
+        text.str.strip().ne('')
+        & text.str.contains(PARSABLE_SPACING_PATTERN).astype(bool)
+        & text.str.contains(PARSABLE_NAME_PATTERN).astype(bool)
+    )
+
+
+def divide_ye(df): # 예금 명세를 항목별로 나눔
+    return expand_rows(df, df[ASSET_TYPE_COLUMN_NAME].eq(ASSET_TYPE_DEPOSIT))
+
+
+def divide_ch(df): # 채무 명세를 항목별로 나누고, 정치자금 예금은 이름만 남김
+    df = df.reset_index(drop=True)
+    fund = df[ASSET_TYPE_COLUMN_NAME].eq(ASSET_TYPE_POLITICAL_FUND)
+    df = replace_details(df, fund, political_fund_names)
+    return expand_rows(df, df[ASSET_TYPE_COLUMN_NAME].eq(ASSET_TYPE_DEBT))
+
+
+def divide_hap(df): # 정치자금 예금, 출자지분 명세를 이름만 남김 (행 수는 그대로)
+    df = df.reset_index(drop=True)
+    asset_type = df[ASSET_TYPE_COLUMN_NAME]
+    df = replace_details(df, asset_type.eq(ASSET_TYPE_POLITICAL_FUND), political_fund_names)
+    df = replace_details(df, asset_type.eq(ASSET_TYPE_PARTNERSHIP_SHARE), names_before_first_comma)
+    return clean_amounts(df)
+
+
+def divide_re(df): # 예금/채무 중 아직 나뉘지 않은 명세만 다시 나눔
+    asset_type = as_text(df[ASSET_TYPE_COLUMN_NAME]).str.strip()
+    mask = asset_type.isin([ASSET_TYPE_DEPOSIT, ASSET_TYPE_DEBT]) & is_parsable_details(df[DETAIL_COLUMN_NAME])
+    return expand_rows(df, mask)
+
+
+STEPS = {
+    'ye': divide_ye,
+    'ch': divide_ch,
+    'hap': divide_hap,
+    're': divide_re,
+}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='자산 명세 열 분리 / 금액 정리')
+    parser.add_argument('step', choices=STEPS, help='ye: 예금 분리, ch: 채무 분리, hap: 정치자금/출자지분 이름 정리, re: 예금/채무 재분리')
+    parser.add_argument('input', help='입력 CSV 파일 (utf-8-sig)')
+    parser.add_argument('output', help='출력 CSV 파일')
+    args = parser.parse_args(argv)
+
+    df = pd.read_csv(args.input, encoding='utf-8-sig')
+    print(f"'{args.input}' 파일을 읽었습니다. 원본 데이터 행 수: {len(df)}")
+    missing = [col for col in REQUIRED_COLUMNS if col not in df.columns]
+    if missing:
+        parser.error(f"필수 열 {missing} 을(를) 찾을 수 없습니다. 현재 CSV 파일의 열: {df.columns.tolist()}")
+
+    result = STEPS[args.step](df)
+    print(f"처리 후 데이터 행 수: {len(result)}")
+    result.to_csv(args.output, index=False, encoding='utf-8-sig')
+    print(f"처리된 데이터가 '{args.output}' 파일로 저장되었습니다.")
+
+
+if __name__ == '__main__':
+    main()
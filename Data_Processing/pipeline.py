@@ -0,0 +1,147 @@
+# 재산공개 정리 파이프라인: su_data4 -> su_data7 -> col_divide (re, hap) -> ID_Matching
+# 단계마다 중간 CSV 를 쓰지 않고 메모리에서 이어서 처리, 의원별로 나눠서 여러 프로세스에서 실행
+# 사용법: python pipeline.py data1.xlsx 출력.csv --reference legislators.csv --workers 4
+# 'match' 단계는 ow.matching.MemberMatcher 로 의원 ID 를 채우고 동명이인 등 확인이 필요한 이름은 보고서 CSV 로 저장
+import argparse
+import contextlib
+import io
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+import pandas as pd
+
+if not __package__: # python pipeline.py 로 실행하면 저장소 루트가 import 경로에 없음
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Data_Processing import col_divide
+from NotRegular_data_process import su_data4, su_data7
+from ow.matching import MemberMatcher, read_csv_text
+
+# su_data4 / su_data7 의 영어 컬럼 -> col_divide 의 한글 컬럼
+COL_DIVIDE_COLUMNS = {
+    'asset_type': col_divide.ASSET_TYPE_COLUMN_NAME,
+    'detail': col_divide.DETAIL_COLUMN_NAME,
+    'origin_valuation': col_divide.COL_PREVIOUS_VALUE,
+    'increased_amount': col_divide.COL_INCREASE_VALUE,
+    'decreased_amount': col_divide.COL_DECREASE_VALUE,
+    'current_valuation': col_divide.COL_CURRENT_VALUE,
+}
+MEMBER_COLUMNS = ['name', '의원명', 'member_id', '의원ID'] # 앞에 있는 것부터, 의원을 나누는 기준
+
+STAGES = ['convert', 'split', 'ye', 'ch', 're', 'hap', 'match'] # 실행 순서
+# ye/ch 는 명세를 항상 다시 나눠서 su_data7 이 이미 나눈 금액을 0 으로 만듦 -> 기본은 아직 안 나뉜 명세만 나누는 re
+DEFAULT_STAGES = ['convert', 'split', 're', 'hap', 'match']
+ROW_STAGES = STAGES[1:] # 행 단위로 처리해서 의원별로 나눠도 결과가 같은 단계
+
+
+def run_col_divide(step, df): # 영어 컬럼이면 한글로 바꿔서 col_divide 단계 실행 후 되돌림
+    columns = {english: korean for english, korean in COL_DIVIDE_COLUMNS.items() if english in df.columns}
+    result = col_divide.STEPS[step](df.rename(columns=columns))
+    return result.rename(columns={korean: english for english, korean in columns.items()})
+
+
+def run_stage(stage, df, matcher=None):
+    if stage == 'split':
+        return su_data7.split_details(df)
+    if stage in col_divide.STEPS:
+        return run_col_divide(stage, df)
+    if stage == 'match':
+        return matcher.match(df) if matcher is not None else df
+    raise ValueError(f'알 수 없는 단계: {stage}')
+
+
+def partition_by_member(df):
+    """같은 의원이 연속된 행 묶음 목록 (원래 순서). 의원 컬럼이 없으면 전체 1개"""
+    column = next((column for column in MEMBER_COLUMNS if column in df.columns), None)
+    if column is None or df.empty:
+        return [df] if not df.empty else []
+    member = df[column].astype(object).where(df[column].notna(), '')
+    boundaries = member.ne(member.shift()).cumsum()
+    return [part.reset_index(drop=True) for _, part in df.groupby(boundaries, sort=False)]
+
+
+def process_partition(df, stages, matcher=None, verbose=False):
+    """의원 1명 분량의 행에 단계들을 차례로 적용 (작업 프로세스에서 실행)"""
+    output = contextlib.nullcontext() if verbose else contextlib.redirect_stdout(io.StringIO())
+    with output:
+        for stage in stages:
+            df = run_stage(stage, df, matcher)
+    return df
+
+
+def run_pipeline(df, stages, matcher=None, workers=1, verbose=False):
+    """
+    행 단위 단계들을 의원별 묶음마다 실행하고 원래 순서대로 합침.
+    묶음 나누기가 workers 와 상관없어서 프로세스 수와 관계없이 결과가 같음 (workers=1 은 현재 프로세스에서 순차 실행).
+    'match' 는 마지막 단계라서 묶음마다 현재 프로세스에서 matcher.match 로 처리 (매칭 결과와 보고서가 matcher 에 쌓임)
+    """
+    partitions = partition_by_member(df)
+    row_stages = [stage for stage in stages if stage != 'match']
+    func = partial(process_partition, stages=row_stages, verbose=verbose)
+    if workers <= 1 or len(partitions) <= 1:
+        results = [func(part) for part in partitions]
+    else:
+        chunksize = max(1, len(partitions) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(func, partitions, chunksize=chunksize)) # map 은 입력 순서대로 돌려줌
+    if 'match' in stages:
+        results = [run_stage('match', part, matcher) for part in results]
+    if not results:
+        return df.iloc[0:0]
+    return pd.concat(results, ignore_index=True)
+
+
+def read_input(path, stages):
+    if stages and stages[0] == 'convert': # 재산공개 Excel (헤더 없음), read_only 로 한 행씩 변환
+        return su_data4.read_sheet(path)
+    return pd.read_csv(path, encoding='utf-8-sig')
+
+
+def read_reference(path): # 참조 의원 CSV (member_id, name, 있으면 chi_name/birth/latest_age/electoral_district) 색인
+    return MemberMatcher(read_csv_text(path))
+
+
+def write_match_report(matcher, report_path): # match_members 명령과 같은 보고서 CSV + 요약 출력
+    report = matcher.report()
+    report.to_csv(report_path, index=False, encoding='utf-8-sig')
+    summary = matcher.summary()
+    print(f"의원 매칭: 정확 {summary['exact']}, 유사 {summary['fuzzy']}, "
+          f"동명이인 {summary['ambiguous']}, 실패 {summary['unmatched']}")
+    print(f"보고서 ({len(report)}개 이름): {report_path}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='재산공개 정리 단계를 메모리에서 이어서 실행 (의원별 병렬 처리)')
+    parser.add_argument('input', help="입력 파일 ('convert' 단계부터면 재산공개 Excel, 아니면 CSV)")
+    parser.add_argument('output', help='출력 CSV 파일')
+    parser.add_argument('--stages', nargs='+', choices=STAGES, default=DEFAULT_STAGES,
+                        help=f"실행할 단계, 순서는 항상 {' -> '.join(STAGES)} (기본값: {' '.join(DEFAULT_STAGES)})")
+    parser.add_argument('--reference', help="'match' 단계의 참조 CSV (name, member_id). 없으면 'match' 는 건너뜀")
+    parser.add_argument('--report', help="'match' 단계의 확인이 필요한 이름 보고서 (기본값: <출력>_match_report.csv)")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='작업 프로세스 수 (기본값: CPU 수, 1 이면 순차 실행)')
+    parser.add_argument('--verbose', action='store_true', help='각 단계의 행 단위 로그 출력')
+    args = parser.parse_args(argv)
+
+    stages = [stage for stage in STAGES if stage in args.stages]
+    matcher = None
+    if 'match' in stages:
+        if args.reference:
+            matcher = read_reference(args.reference)
+        else:
+            print("참조 CSV(--reference)가 없어서 'match' 단계를 건너뜁니다.")
+            stages.remove('match')
+
+    df = read_input(args.input, stages)
+    print(f"입력 {len(df)}개 행, 단계: {' -> '.join(stages)}, 작업 프로세스 {max(args.workers, 1)}개")
+    result = run_pipeline(df, [stage for stage in stages if stage in ROW_STAGES], matcher, args.workers, args.verbose)
+    result.to_csv(args.output, index=False, encoding='utf-8-sig')
+    print(f"처리 후 {len(result)}개 행 -> '{args.output}'")
+    if matcher is not None:
+        write_match_report(matcher, args.report or f'{os.path.splitext(args.output)[0]}_match_report.csv')
+    return result
+
+
+if __name__ == '__main__':
+    main()
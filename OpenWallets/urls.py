@@ -14,14 +14,16 @@ Including another URLconf
     1. Import the include() function: from django.urls import include, path
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
-from django.urls import path
+from django.urls import include, path
 from ow import views
 
 # url 페이지
 urlpatterns = [
     path('', views.main_page, name="main_page"),
     path('members/', views.member_list, name="member_list") ,
+    path('members/autocomplete/', views.member_autocomplete, name='member_autocomplete'),
     path('members/<str:member_id>/', views.member_info, name='member_info'),
     path('api/', views.api_page, name="api_page") ,
+    path('api/v1/', include('ow.api')), # 읽기 전용 JSON API
     path('guide/', views.guide_page, name="guide_page") ,
 ]
\ No newline at end of file
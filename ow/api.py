@@ -0,0 +1,219 @@
+# 읽기 전용 JSON API (v1): 필드 선택, 필터, 커서 페이지네이션, 조건부 GET, 전체 데이터 스트리밍
+import csv
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import Http404, JsonResponse, StreamingHttpResponse
+from django.urls import path
+from rest_framework import generics
+from rest_framework.exceptions import ValidationError
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+from ow.cache import conditional_view
+from ow.models import Legislator, Asset
+from ow.pagination import KeysetPaginator
+from ow.search import search_legislators
+from ow.serializers import LegislatorSerializer, AssetSerializer
+
+API_PAGE_SIZE = 100 # 기본 페이지 크기
+API_MAX_PAGE_SIZE = 1000 # ?page_size 최대값
+BULK_CHUNK_SIZE = 2000 # 스트리밍 시 DB 에서 한 번에 읽는 행 수
+
+# ?ordering 값 -> 커서 키 (마지막 필드는 유일)
+LEGISLATOR_ORDERINGS = {
+    'member_id': ['member_id'],
+    'name': ['name', 'member_id'],
+    '-total_assets': ['-total_assets', 'member_id'],
+}
+ASSET_ORDERINGS = {
+    'id': ['id'],
+    '-report': ['-report_year', '-report_month', 'id'], # 최신 신고순
+}
+
+
+def int_param(params, name): # 정수 파라미터 (없으면 None, 잘못된 값은 400)
+    value = params.get(name)
+    if value in (None, ''):
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        raise ValidationError({name: '정수여야 합니다.'})
+
+
+def filter_legislators(queryset, params): # ?party= &region= &term= &q=
+    if params.get('party'):
+        queryset = queryset.filter(party=params['party'])
+    if params.get('region'):
+        queryset = queryset.filter(region=params['region'])
+    term = int_param(params, 'term')
+    if term is not None:
+        queryset = queryset.filter(latest_term=term)
+    if params.get('q'):
+        queryset = search_legislators(params['q'], queryset)
+    return queryset
+
+
+def filter_assets(queryset, params): # ?member_id= &year= &month= &asset_type= &relation=
+    if params.get('member_id'):
+        queryset = queryset.filter(legislator_id=params['member_id'])
+    year = int_param(params, 'year')
+    if year is not None:
+        queryset = queryset.filter(report_year=year)
+    month = int_param(params, 'month')
+    if month is not None:
+        queryset = queryset.filter(report_month=month)
+    if params.get('asset_type'):
+        queryset = queryset.filter(asset_type=params['asset_type'])
+    if params.get('relation'):
+        queryset = queryset.filter(relation=params['relation'])
+    return queryset
+
+
+class KeysetCursorPagination(BasePagination):
+    """ow.pagination.KeysetPaginator 를 쓰는 커서 페이지네이션 (COUNT 없음, 응답: next/previous/results)"""
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        page_size = int_param(request.query_params, 'page_size') or API_PAGE_SIZE
+        page_size = min(max(page_size, 1), API_MAX_PAGE_SIZE)
+        paginator = KeysetPaginator(queryset, page_size, view.get_ordering())
+        self.page = paginator.get_page(cursor=request.query_params.get('cursor'))
+        return list(self.page)
+
+    def link(self, cursor):
+        if not cursor:
+            return None
+        return replace_query_param(self.request.build_absolute_uri(), 'cursor', cursor)
+
+    def get_paginated_response(self, data):
+        return Response({
+            'next': self.link(self.page.next_cursor()),
+            'previous': self.link(self.page.previous_cursor()),
+            'results': data,
+        })
+
+
+class ReadOnlyApiMixin:
+    """?fields= 로 고른 컬럼만 DB 에서 읽고 (only), 같은 필드만 직렬화"""
+    model = None
+    orderings = {}
+    default_ordering = None
+
+    def selected_fields(self):
+        return self.serializer_class.selected_fields(self.request.query_params)
+
+    def get_ordering(self):
+        key = self.request.query_params.get('ordering') or self.default_ordering
+        if key not in self.orderings:
+            raise ValidationError({'ordering': f"다음 중 하나여야 합니다: {', '.join(self.orderings)}"})
+        return self.orderings[key]
+
+    def get_queryset(self):
+        columns = set(self.selected_fields())
+        if self.pagination_class is not None:
+            columns.update(field.lstrip('-') for field in self.get_ordering()) # 커서 키도 필요
+        return self.model.objects.only(*columns)
+
+    def get_serializer(self, *args, **kwargs):
+        kwargs['fields'] = self.selected_fields()
+        return super().get_serializer(*args, **kwargs)
+
+
+class LegislatorList(ReadOnlyApiMixin, generics.ListAPIView):
+    model = Legislator
+    serializer_class = LegislatorSerializer
+    pagination_class = KeysetCursorPagination
+    orderings = LEGISLATOR_ORDERINGS
+    default_ordering = 'member_id'
+
+    def get_queryset(self):
+        return filter_legislators(super().get_queryset(), self.request.query_params)
+
+
+class LegislatorDetail(ReadOnlyApiMixin, generics.RetrieveAPIView):
+    model = Legislator
+    serializer_class = LegislatorSerializer
+    pagination_class = None
+    lookup_field = 'member_id'
+
+
+class AssetList(ReadOnlyApiMixin, generics.ListAPIView):
+    model = Asset
+    serializer_class = AssetSerializer
+    pagination_class = KeysetCursorPagination
+    orderings = ASSET_ORDERINGS
+    default_ordering = 'id'
+
+    def get_queryset(self):
+        return filter_assets(super().get_queryset(), self.request.query_params)
+
+
+class AssetDetail(ReadOnlyApiMixin, generics.RetrieveAPIView):
+    model = Asset
+    serializer_class = AssetSerializer
+    pagination_class = None
+
+
+class Echo: # csv.writer 가 쓴 한 줄을 그대로 돌려주는 버퍼 (스트리밍용)
+    def write(self, value):
+        return value
+
+
+def stream_rows(queryset, fields, fmt):
+    """values_list().iterator() 로 BULK_CHUNK_SIZE 씩 읽어서 chunk 단위 문자열로 내보냄 (메모리 일정)"""
+    rows = queryset.values_list(*fields).iterator(chunk_size=BULK_CHUNK_SIZE)
+    if fmt == 'csv':
+        writer = csv.writer(Echo())
+        yield '\ufeff' + writer.writerow(fields) # export_data 와 같은 utf-8-sig (엑셀 호환)
+        encode = writer.writerow
+    else:
+        encoder = DjangoJSONEncoder(ensure_ascii=False)
+        encode = lambda row: encoder.encode(dict(zip(fields, row))) + '\n'
+
+    chunk = []
+    for row in rows:
+        chunk.append(encode(row))
+        if len(chunk) >= BULK_CHUNK_SIZE:
+            yield ''.join(chunk)
+            chunk = []
+    if chunk:
+        yield ''.join(chunk)
+
+
+# 전체 데이터 스트리밍: 리소스 -> (모델, serializer, 필터, 정렬)
+BULK_RESOURCES = {
+    'legislators': (Legislator, LegislatorSerializer, filter_legislators, 'member_id'),
+    'assets': (Asset, AssetSerializer, filter_assets, 'id'),
+}
+BULK_FORMATS = {
+    'ndjson': 'application/x-ndjson; charset=utf-8',
+    'csv': 'text/csv; charset=utf-8',
+}
+
+
+@conditional_view
+def bulk_export(request, resource, fmt): # /api/v1/<resource>/bulk.<ndjson|csv>
+    if resource not in BULK_RESOURCES or fmt not in BULK_FORMATS:
+        raise Http404
+    model, serializer_class, filter_func, ordering = BULK_RESOURCES[resource]
+    try:
+        queryset = filter_func(model.objects.order_by(ordering), request.GET)
+    except ValidationError as e:
+        return JsonResponse(e.detail, status=400)
+
+    fields = serializer_class.selected_fields(request.GET)
+    response = StreamingHttpResponse(stream_rows(queryset, fields, fmt), content_type=BULK_FORMATS[fmt])
+    response['Content-Disposition'] = f'attachment; filename="{resource}.{fmt}"'
+    return response
+
+
+# OpenWallets/urls.py 에서 api/v1/ 아래로 include
+urlpatterns = [
+    path('legislators/', conditional_view(LegislatorList.as_view()), name='api_legislator_list'),
+    path('legislators/bulk.<str:fmt>', bulk_export, {'resource': 'legislators'}, name='api_legislator_bulk'),
+    path('legislators/<str:member_id>/', conditional_view(LegislatorDetail.as_view()), name='api_legislator_detail'),
+    path('assets/', conditional_view(AssetList.as_view()), name='api_asset_list'),
+    path('assets/bulk.<str:fmt>', bulk_export, {'resource': 'assets'}, name='api_asset_bulk'),
+    path('assets/<int:pk>/', conditional_view(AssetDetail.as_view()), name='api_asset_detail'),
+]
@@ -4,3 +4,8 @@ from django.apps import AppConfig
 class OwConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'ow'
+
+    def ready(self):
+        from django.db.backends.signals import connection_created
+        from ow.db import configure_sqlite
+        connection_created.connect(configure_sqlite, dispatch_uid='ow.configure_sqlite')
@@ -0,0 +1,84 @@
+# 페이지 응답 캐시 (데이터는 import 할 때만 바뀌므로 import 때마다 버전을 올려서 무효화)
+import datetime
+import hashlib
+import time
+from functools import wraps
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+
+DATA_VERSION_KEY = 'ow:data_version' # 전역 데이터 버전 (마지막 import 시각, ms)
+
+
+def bump_data_version(): # import 가 끝날 때 호출 -> 이전 버전으로 만든 캐시는 모두 무효
+    version = int(time.time() * 1000)
+    cache.set(DATA_VERSION_KEY, version, timeout=None)
+    return version
+
+
+def get_data_version():
+    version = cache.get(DATA_VERSION_KEY)
+    if version is None: # 캐시가 비워졌으면 새 버전으로 시작
+        version = bump_data_version()
+    return version
+
+
+def normalized_query(request): # 값이 빈 파라미터는 빼고 키 순서대로 정렬한 쿼리스트링
+    params = sorted((key, value) for key, values in request.GET.lists() for value in values if value != '')
+    return urlencode(params)
+
+
+def version_validators(request): # (데이터 버전, 요청 해시, ETag, Last-Modified)
+    version = get_data_version()
+    digest = hashlib.sha1(f"{request.path}?{normalized_query(request)}".encode('utf-8')).hexdigest()
+    etag = quote_etag(f"{version}-{digest[:16]}")
+    return version, digest, etag, version // 1000
+
+
+def set_validators(response, etag, last_modified): # 정상 응답에만 붙임 (404 등은 조건부 요청 대상이 아님)
+    if response.status_code == 200:
+        response['ETag'] = etag
+        response['Last-Modified'] = http_date(last_modified)
+    return response
+
+
+def conditional_view(view):
+    """캐시 없이 ETag/Last-Modified 만 붙이고 If-None-Match / If-Modified-Since 가 맞으면 304 (API, 스트리밍 응답용)"""
+    @wraps(view)
+    def wrapper(request, *args, **kwargs):
+        if request.method not in ('GET', 'HEAD'):
+            return view(request, *args, **kwargs)
+
+        _, _, etag, last_modified = version_validators(request)
+        not_modified = get_conditional_response(request, etag=etag, last_modified=last_modified)
+        if not_modified is not None:
+            return not_modified
+        return set_validators(view(request, *args, **kwargs), etag, last_modified)
+    return wrapper
+
+
+def cached_view(view):
+    """GET 응답을 (view, 경로, 정리된 쿼리스트링, 데이터 버전) 단위로 캐시하고 ETag/Last-Modified 를 붙이는 데코레이터"""
+    @wraps(view)
+    def wrapper(request, *args, **kwargs):
+        if request.method not in ('GET', 'HEAD'):
+            return view(request, *args, **kwargs)
+
+        version, digest, etag, last_modified = version_validators(request)
+
+        # If-None-Match / If-Modified-Since 가 맞으면 304
+        not_modified = get_conditional_response(request, etag=etag, last_modified=last_modified)
+        if not_modified is not None:
+            return not_modified
+
+        key = f"ow:view:{view.__name__}:{version}:{digest}"
+        response = cache.get(key)
+        if response is None:
+            response = view(request, *args, **kwargs)
+            if response.status_code == 200:
+                cache.set(key, response, settings.VIEW_CACHE_TIMEOUT)
+        return set_validators(response, etag, last_modified)
+    return wrapper
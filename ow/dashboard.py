@@ -0,0 +1,104 @@
+# 대시보드(main_page) 집계 미리 계산
+from django.db import transaction
+from django.db.models import Sum
+from django.db.models.functions import Left
+from ow.db import dashboard_view_totals, is_postgres, refresh_dashboard_views
+from ow.models import CURRENT_TERM, Legislator, DashboardSnapshot
+from ow.cache import bump_data_version
+from ow.search import rebuild_search_index
+
+TOP_MEMBERS = 20 # 상단 슬라이더에 보여줄 의원 수
+TOP_PER_GROUP = 5 # 지역/정당별 상위 의원 수
+
+
+def member_card(member): # 상단 슬라이더 카드 (템플릿에서 정당 색을 씀)
+    return {
+        'member_id': member.member_id,
+        'name': member.name,
+        'party': member.party,
+        'total_assets': member.total_assets or 0,
+    }
+
+
+def top5_card(member):
+    # main_page.html 이 {{ region_top5|safe }} 로 JS 에 그대로 넣으므로 None 이 될 수 있는 값은 넣지 않음
+    return {'name': member.name, 'total_assets': member.total_assets or 0, 'member_id': member.member_id}
+
+
+def sorted_totals(totals): # {그룹 값: 합계} 를 그룹 값 순으로 (DB 백엔드, jsonb 저장과 상관없이 차트 순서 고정)
+    return dict(sorted(totals.items()))
+
+
+def group_top_members(queryset, field, n=TOP_PER_GROUP): # {그룹 값: [상위 n명 카드]} (쿼리 1번)
+    grouped = {}
+    for member in queryset.top_n_per_group(field, n):
+        grouped.setdefault(member.group_key, []).append(top5_card(member))
+    return grouped
+
+
+def compute_dashboard(): # 모든 데이터는 22대로 제한
+    current = Legislator.objects.current()
+    # 지역 집계는 비례대표 제외, 지역 = 선거구 앞 2글자
+    districts = current.exclude(
+        electoral_district__isnull=True
+    ).exclude(
+        electoral_district__startswith='비례'
+    )
+    short_region = Left('electoral_district', 2)
+    parties = current.exclude(party__isnull=True)
+
+    # 재산 총에 기준으로 내림차순 정렬하여 상위 의원 20명
+    top_members = [member_card(m) for m in current.order_by('-total_assets', 'member_id')[:TOP_MEMBERS]]
+
+    if is_postgres(): # 지역별 / 정당별 자산 합계는 materialized view 에서 읽음 (rebuild_dashboard_snapshot 에서 갱신)
+        region_assets = sorted_totals(dashboard_view_totals('ow_region_assets', CURRENT_TERM))
+        party_assets = sorted_totals(dashboard_view_totals('ow_party_assets', CURRENT_TERM))
+    else:
+        # 지역별 자산 합계
+        assets_by_region_qs = districts.annotate(short_region=short_region).values('short_region').annotate(
+            total_assets=Sum('total_assets')
+        )
+        region_assets = sorted_totals({item['short_region']: item['total_assets'] for item in assets_by_region_qs})
+
+        # 정당별 자산 합계
+        assets_by_party_qs = parties.values('party').annotate(total_assets=Sum('total_assets'))
+        party_assets = sorted_totals({item['party']: item['total_assets'] for item in assets_by_party_qs})
+
+    # 지역별 / 정당별 상위 5명 (그룹 수와 상관없이 각각 쿼리 1번)
+    region_top5 = group_top_members(districts, short_region)
+    party_top5 = group_top_members(parties, 'party')
+
+    return {
+        'top_members': top_members,
+        'region_assets': region_assets,
+        'party_assets': party_assets,
+        'region_top5': region_top5,
+        'party_top5': party_top5,
+    }
+
+
+def rebuild_dashboard_snapshot(): # 집계를 다시 계산해서 스냅샷 1개만 남김 (import 후 호출)
+    refresh_dashboard_views()
+    data = compute_dashboard()
+    with transaction.atomic():
+        snapshot = DashboardSnapshot.objects.create(data=data)
+        DashboardSnapshot.objects.exclude(pk=snapshot.pk).delete()
+    return snapshot
+
+
+def refresh_after_import(): # import 계열 명령이 끝날 때 호출: 대시보드 재계산 + 검색 색인 + 페이지 캐시 무효화
+    snapshot = rebuild_dashboard_snapshot()
+    rebuild_search_index()
+    bump_data_version()
+    return snapshot
+
+
+def get_dashboard_data(): # 최신 스냅샷 읽기 (없으면 만들어서 저장)
+    snapshot = DashboardSnapshot.objects.order_by('-created_at').first()
+    if snapshot is None:
+        snapshot = rebuild_dashboard_snapshot()
+    data = snapshot.data
+    # PostgreSQL jsonb 는 키 순서를 저장하지 않으므로 읽을 때 다시 정렬
+    data['region_assets'] = sorted_totals(data['region_assets'])
+    data['party_assets'] = sorted_totals(data['party_assets'])
+    return data
@@ -0,0 +1,119 @@
+# DB 백엔드별 설정과 빠른 경로
+# - SQLite: 새 연결마다 settings.SQLITE_PRAGMAS 적용 (WAL, busy_timeout 등)
+#   gunicorn worker 들이 읽는 동안 import 명령이 써도 "database is locked" 가 나지 않도록
+#   쓰기 명령은 immediate_transactions 로 트랜잭션을 BEGIN IMMEDIATE 로 시작
+# - PostgreSQL: 대량 저장은 COPY FROM STDIN, 대시보드 합계는 materialized view (0011 마이그레이션)
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.db import connection
+
+# 대시보드 합계 materialized view (0011 에서 만듦), import 후 rebuild_dashboard_snapshot 에서 갱신
+DASHBOARD_VIEWS = ['ow_region_assets', 'ow_party_assets']
+
+
+def sqlite_pragmas():
+    return getattr(settings, 'SQLITE_PRAGMAS', {})
+
+
+def apply_pragmas(cursor, pragmas): # PRAGMA 이름 -> 값, 순서대로 실행
+    for name, value in pragmas.items():
+        cursor.execute(f"PRAGMA {name} = {value}")
+
+
+def configure_sqlite(sender, connection, **kwargs): # connection_created 시그널 (OwConfig.ready 에서 연결)
+    if connection.vendor != 'sqlite':
+        return
+    pragmas = dict(sqlite_pragmas())
+    if connection.is_in_memory_db():
+        pragmas.pop('journal_mode', None) # 메모리 DB(테스트)는 WAL 을 쓸 수 없음
+        pragmas.pop('mmap_size', None)
+    with connection.cursor() as cursor:
+        apply_pragmas(cursor, pragmas)
+
+
+@contextmanager
+def immediate_transactions(conn=None):
+    """블록 안의 atomic() 을 BEGIN IMMEDIATE 로 시작 (SQLite, import 계열 명령의 handle 에 데코레이터로 사용)
+
+    DEFERRED 트랜잭션은 읽다가 쓰기로 바꿀 때 다른 연결이 먼저 썼으면 busy_timeout 없이 바로 실패함.
+    웹 요청(읽기 위주)은 기본 DEFERRED 로 두어서 긴 import 뒤에 줄 서지 않게 함.
+    """
+    conn = conn or connection
+    if conn.vendor != 'sqlite':
+        yield
+        return
+    previous = conn.transaction_mode
+    conn.transaction_mode = 'IMMEDIATE'
+    try:
+        yield
+    finally:
+        conn.transaction_mode = previous
+
+
+def is_postgres():
+    return connection.vendor == 'postgresql'
+
+
+def copy_columns(model): # COPY 할 컬럼 (자동 증가 id 는 DB 가 채움)
+    return [field for field in model._meta.concrete_fields if field is not model._meta.auto_field]
+
+
+def copy_into_temp_table(cursor, model, objs):
+    """objs 를 model 테이블과 같은 컬럼의 임시 테이블로 COPY FROM STDIN (트랜잭션이 끝나면 삭제됨)
+
+    반환값: (임시 테이블 이름, 컬럼 목록 SQL)
+    """
+    fields = copy_columns(model)
+    qn = connection.ops.quote_name
+    table = qn(model._meta.db_table)
+    temp_table = qn(f"{model._meta.db_table}_load")
+    columns = ', '.join(qn(field.column) for field in fields)
+    cursor.execute(f"DROP TABLE IF EXISTS {temp_table}") # 바깥 트랜잭션(--dry-run) 안이면 이전 batch 의 임시 테이블이 남아 있음
+    cursor.execute(f"CREATE TEMP TABLE {temp_table} ON COMMIT DROP AS SELECT {columns} FROM {table} WITH NO DATA")
+    with cursor.copy(f"COPY {temp_table} ({columns}) FROM STDIN") as copy: # psycopg 3
+        for obj in objs:
+            # pre_save: auto_now(updated_at) 등 bulk_create 와 같은 값
+            copy.write_row([field.get_db_prep_save(field.pre_save(obj, True), connection) for field in fields])
+    return temp_table, columns
+
+
+def copy_upsert(model, objs, unique_field, update_fields=None):
+    """
+    COPY 로 임시 테이블에 넣은 뒤 INSERT ... SELECT ... ON CONFLICT 로 옮김 (batch 당 COPY 1번 + INSERT 1번)
+    update_fields 가 있으면 겹치는 행을 갱신(DO UPDATE), 없으면 건너뜀(DO NOTHING). 반환값: 새로 추가된 행 수
+    트랜잭션 안에서 호출해야 함 (임시 테이블은 커밋 때 삭제)
+    """
+    qn = connection.ops.quote_name
+    key = qn(model._meta.get_field(unique_field).column)
+    with connection.cursor() as cursor:
+        temp_table, columns = copy_into_temp_table(cursor, model, objs)
+        insert = f"INSERT INTO {qn(model._meta.db_table)} ({columns}) SELECT {columns} FROM {temp_table}"
+        if not update_fields:
+            cursor.execute(f"{insert} ON CONFLICT ({key}) DO NOTHING")
+            return cursor.rowcount
+        assignments = ', '.join(
+            f"{column} = EXCLUDED.{column}"
+            for column in (qn(model._meta.get_field(name).column) for name in update_fields)
+        )
+        # xmax = 0 이면 새로 추가된 행, 아니면 갱신된 행
+        cursor.execute(f"{insert} ON CONFLICT ({key}) DO UPDATE SET {assignments} RETURNING (xmax = 0)")
+        return sum(inserted for inserted, in cursor.fetchall())
+
+
+def refresh_dashboard_views(): # 대시보드 합계 view 갱신 (CONCURRENTLY: 갱신 중에도 읽기 가능)
+    if not is_postgres():
+        return
+    with connection.cursor() as cursor:
+        for view in DASHBOARD_VIEWS:
+            cursor.execute(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {connection.ops.quote_name(view)}")
+
+
+def dashboard_view_totals(view, term): # {그룹 값: 자산 합계} (해당 대수, 그룹 값 순)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"SELECT group_key, total_assets FROM {connection.ops.quote_name(view)} WHERE latest_term = %s "
+            "ORDER BY group_key",
+            [term],
+        )
+        return dict(cursor.fetchall())
@@ -0,0 +1,12 @@
+from django.core.management.base import BaseCommand
+from ow.dashboard import refresh_after_import
+from ow.db import immediate_transactions
+
+
+class Command(BaseCommand):
+    help = 'main_page 대시보드 집계 스냅샷을 다시 계산 (페이지 캐시도 무효화).'
+
+    @immediate_transactions()
+    def handle(self, *args, **options):
+        snapshot = refresh_after_import()
+        self.stdout.write(self.style.SUCCESS(f"대시보드 스냅샷 생성: {snapshot}"))
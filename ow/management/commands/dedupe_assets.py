@@ -0,0 +1,82 @@
+import time
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from ow.models import Asset
+from ow.dashboard import refresh_after_import
+from ow.services import recompute_total_assets, record_changed_members, DEFAULT_STATUS_FILE
+from ow.db import immediate_transactions
+
+DEFAULT_BATCH_SIZE = 1000 # 한 트랜잭션에서 처리할 행 수 (짧게 잡아서 서비스 중에도 잠금이 오래 걸리지 않게)
+
+
+class Command(BaseCommand):
+    help = 'row_hash 가 비어 있는 자산(0009 마이그레이션 전부터 중복이던 행)을 정리: 중복은 삭제하고 나머지는 해시를 채움.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE,
+                            help=f'한 트랜잭션에서 처리할 행 수 (기본값: {DEFAULT_BATCH_SIZE})')
+        parser.add_argument('--sleep', type=float, default=0, help='batch 사이에 쉬는 시간(초), 운영 DB 부하 조절용')
+        parser.add_argument('--dry-run', action='store_true', help='삭제/저장하지 않고 개수만 출력')
+        parser.add_argument('--status-file', type=str, default=DEFAULT_STATUS_FILE,
+                            help='자산이 삭제된 의원을 기록할 상태 파일 (update_latest_assets --only-changed 에서 사용)')
+
+    @immediate_transactions()
+    def handle(self, *args, **options):
+        batch_size = max(options['batch_size'], 1)
+        dry_run = options['dry_run']
+        self.claimed = {} # 이번 실행에서 해시를 채운 행: row_hash -> (id, openwatch_asset_id)
+        self.members = set()
+        filled = deleted = 0
+        last_id = 0
+        while True:
+            batch = list(Asset.objects.filter(row_hash__isnull=True, id__gt=last_id).order_by('id')[:batch_size])
+            if not batch:
+                break
+            last_id = batch[-1].id
+            with transaction.atomic():
+                batch_filled, batch_deleted = self.dedupe_batch(batch, dry_run)
+            filled += batch_filled
+            deleted += batch_deleted
+            self.stdout.write(f"  batch (~id {last_id}): 해시 채움 {batch_filled}, 중복 삭제 {batch_deleted}")
+            if options['sleep']:
+                time.sleep(options['sleep'])
+
+        self.stdout.write(self.style.SUCCESS(f" - 해시 채움: {filled}, 중복 삭제: {deleted}"))
+        if dry_run:
+            self.stdout.write(self.style.WARNING('--dry-run: 저장하지 않았습니다.'))
+        elif deleted:
+            # 중복이 합계에 두 번 들어가 있었을 수 있으므로 해당 의원 총 재산 다시 계산
+            record_changed_members(self.members, options['status_file'])
+            recompute_total_assets(list(self.members))
+            refresh_after_import()
+
+    def dedupe_batch(self, batch, dry_run):
+        """batch 의 행마다 같은 내용의 행(이미 해시가 있는 행 또는 이번 실행에서 먼저 처리한 행)이 있으면 삭제"""
+        hashes = {asset.id: asset.compute_row_hash() for asset in batch}
+        keepers = {
+            row_hash: (keeper_id, openwatch_asset_id)
+            for row_hash, keeper_id, openwatch_asset_id in Asset.objects.filter(
+                row_hash__in=set(hashes.values())
+            ).values_list('row_hash', 'id', 'openwatch_asset_id')
+        }
+        to_fill, to_delete, moved_ids = [], [], {} # moved_ids: 남기는 행 id -> 중복 행에서 옮길 OpenWatch ID
+        for asset in batch:
+            row_hash = hashes[asset.id]
+            keeper = self.claimed.get(row_hash) or keepers.get(row_hash)
+            if keeper is None:
+                asset.row_hash = row_hash
+                to_fill.append(asset)
+                self.claimed[row_hash] = (asset.id, asset.openwatch_asset_id)
+                continue
+            to_delete.append(asset.id)
+            self.members.add(asset.legislator_id)
+            keeper_id, keeper_openwatch_id = keeper
+            if keeper_openwatch_id is None and asset.openwatch_asset_id is not None:
+                moved_ids[keeper_id] = asset.openwatch_asset_id # 다음 fetch_data 때 같은 행으로 upsert 되도록
+                self.claimed[row_hash] = (keeper_id, asset.openwatch_asset_id)
+        if not dry_run:
+            Asset.objects.filter(id__in=to_delete).delete() # 고유 OpenWatch ID 를 옮기기 전에 먼저 삭제
+            Asset.objects.bulk_update(to_fill, ['row_hash'])
+            for keeper_id, openwatch_asset_id in moved_ids.items():
+                Asset.objects.filter(id=keeper_id).update(openwatch_asset_id=openwatch_asset_id)
+        return len(to_fill), len(to_delete)
@@ -1,85 +1,231 @@
 # core/management/commands/export_data.py
-import pandas as pd
-from django.core.management.base import BaseCommand
-from ow.models import Legislator, Asset
+import csv
 import datetime
+import gzip
+import os
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import models
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+from ow.models import Legislator, Asset
+
+EXPORT_FORMATS = ['csv', 'csv.gz', 'parquet', 'xlsx']
+DEFAULT_FORMATS = ['xlsx', 'csv'] # 예전과 같은 출력 (Excel 1개 + CSV 2개)
+DEFAULT_CHUNK_SIZE = 5000 # DB 에서 한 번에 읽고 파일에 쓰는 행 수 (Parquet row group 크기)
+
+# (DB 필드, 파일 컬럼 이름)
+LEGISLATOR_EXPORT_COLUMNS = [
+    ('member_id', 'member_id'),
+    ('name', 'name'),
+    ('party', 'party'),
+    ('gender', 'gender'),
+    ('reelected', 'reelected'),
+    ('electoral_district', 'electoral_district'),
+    ('latest_age', 'latest_age'),
+    # 필요한 다른 필드 추가
+]
+ASSET_EXPORT_COLUMNS = [
+    ('openwatch_asset_id', '자산ID(OpenWatch)'),
+    ('legislator__name', '의원명'),
+    ('legislator_id', '의원ID'),
+    ('report_year', '신고연도'),
+    ('report_month', '신고월'),
+    ('asset_type', '자산구분'),
+    ('kind', '종류'),
+    ('relation', '관계'),
+    ('detail', '상세내역'),
+    ('current_valuation', '현재가액'),
+    ('reason_for_change', '변동사유'),
+    ('origin_valuation', '종전가액'),
+    ('increased_amount', '증가액'),
+    ('decreased_amount', '감소액'),
+    # 필요한 다른 필드 추가
+]
+
+
+def iter_chunks(queryset, fields, chunk_size): # values_list().iterator() 를 chunk_size 행씩 묶어서 (메모리 = chunk 1개)
+    chunk = []
+    for row in queryset.values_list(*fields).iterator(chunk_size=chunk_size):
+        chunk.append(row)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def resolve_field(model, path): # 'legislator__name' -> Legislator.name 필드
+    *relations, name = path.split('__')
+    for relation in relations:
+        model = model._meta.get_field(relation).related_model
+    field = model._meta.get_field(name)
+    return field.target_field if isinstance(field, models.ForeignKey) else field
+
+
+class CsvExportWriter: # CSV / CSV.gz (엑셀에서 바로 열 수 있게 utf-8-sig)
+    def __init__(self, path, model, columns):
+        opener = gzip.open if path.endswith('.gz') else open
+        self.file = opener(path, 'wt', encoding='utf-8-sig', newline='')
+        self.writer = csv.writer(self.file)
+        self.writer.writerow([header for _, header in columns])
+
+    def write(self, rows):
+        self.writer.writerows(rows)
+
+    def close(self):
+        self.file.close()
+
+
+class ParquetExportWriter: # Parquet, chunk 1개 = row group 1개 (pyarrow 필요)
+    def __init__(self, path, model, columns):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        self.pa = pa
+        self.schema = pa.schema([(header, self.arrow_type(resolve_field(model, field))) for field, header in columns])
+        self.writer = pq.ParquetWriter(path, self.schema, compression='snappy')
+
+    def arrow_type(self, field):
+        pa = self.pa
+        if isinstance(field, (models.IntegerField, models.BigIntegerField, models.AutoField)):
+            return pa.int64()
+        if isinstance(field, models.DateTimeField):
+            return pa.timestamp('us', tz='UTC')
+        if isinstance(field, models.DateField):
+            return pa.date32()
+        return pa.string()
+
+    def write(self, rows):
+        columns = list(zip(*rows))
+        table = self.pa.Table.from_arrays(
+            [self.pa.array(column, type=field.type) for column, field in zip(columns, self.schema)],
+            schema=self.schema,
+        )
+        self.writer.write_table(table)
+
+    def close(self):
+        self.writer.close()
+
+
+class XlsxExportWriter: # openpyxl write-only 모드: 행을 바로 임시 파일로 흘려보내서 메모리를 거의 쓰지 않음
+    def __init__(self, workbook, sheet_name, columns):
+        self.sheet = workbook.create_sheet(sheet_name)
+        self.sheet.append([header for _, header in columns])
+
+    def write(self, rows):
+        for row in rows:
+            # Excel 은 timezone 이 있는 datetime 을 저장하지 못함
+            self.sheet.append([value.replace(tzinfo=None) if isinstance(value, datetime.datetime) else value for value in row])
+
+    def close(self):
+        pass
+
 
 class Command(BaseCommand):
-    help = 'Legislator, Asset Excel 파일로 추출출'
+    help = 'Legislator, Asset 을 CSV / CSV.gz / Parquet / Excel 파일로 추출 (chunk 단위 스트리밍)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--format',
+            dest='formats',
+            nargs='+',
+            choices=EXPORT_FORMATS,
+            default=DEFAULT_FORMATS,
+            help=f"출력 형식, 여러 개 가능 (기본값: {' '.join(DEFAULT_FORMATS)})",
+        )
+        parser.add_argument(
+            '--since',
+            type=str,
+            default=None,
+            help='이 시각 이후 수정된(updated_at) 행만 추출 (YYYY-MM-DD 또는 ISO 8601 시각)',
+        )
+        parser.add_argument(
+            '--output-dir',
+            type=str,
+            default='.',
+            help='파일을 저장할 폴더 (기본값: 현재 폴더)',
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=DEFAULT_CHUNK_SIZE,
+            help=f'한 번에 읽고 쓰는 행 수 (기본값: {DEFAULT_CHUNK_SIZE})',
+        )
+
+    def parse_since(self, value): # --since 값 -> timezone 이 있는 datetime
+        if value is None:
+            return None
+        since = parse_datetime(value)
+        if since is None:
+            date = parse_date(value)
+            if date is None:
+                raise CommandError(f'--since 형식이 잘못되었습니다: {value}')
+            since = datetime.datetime.combine(date, datetime.time.min)
+        if timezone.is_naive(since):
+            since = timezone.make_aware(since)
+        return since
 
     def handle(self, *args, **options):
-        self.stdout.write(self.style.NOTICE('Excel로 추출 시작작'))
-
-        try:
-            # 1. 데이터베이스에서 데이터 조회
-            self.stdout.write('DB에서 Legislator 정보 가져오기 시작')
-            legislators_qs = Legislator.objects.all().values(
-                'member_id', 'name', 'party', 'gender', 'reelected', 'electoral_district', 'latest_age'
-                # 필요한 다른 필드 이름 추가
-            )
-            legislators_df = pd.DataFrame(list(legislators_qs))
-            self.stdout.write(f'Fetched {len(legislators_df)} legislator 레코드')
-
-            self.stdout.write('DB에서 Asset 정보 가져오기 시작')
-            assets_qs = Asset.objects.select_related('legislator').all().values(
-                'openwatch_asset_id',
-                'legislator__name',
-                'legislator__member_id',
-                'report_year',
-                'report_month',
-                'asset_type',
-                'kind',
-                'relation',
-                'detail',
-                'current_valuation',
-                'reason_for_change',
-                'origin_valuation',
-                'increased_amount',
-                'decreased_amount'
-                # 필요한 다른 필드 이름 추가
-            )
-            assets_df = pd.DataFrame(list(assets_qs))
-            # 필요시 컬럼 이름 변경
-            assets_df.rename(columns={
-                'legislator__name': '의원명',
-                'legislator__member_id': '의원ID',
-                'openwatch_asset_id': '자산ID(OpenWatch)',
-                'report_year': '신고연도',
-                'report_month': '신고월',
-                'asset_type': '자산구분',
-                'kind': '종류',
-                'relation': '관계',
-                'detail': '상세내역',
-                'current_valuation': '현재가액',
-                'reason_for_change': '변동사유',
-                'origin_valuation': '종전가액',
-                'increased_amount': '증가액',
-                'decreased_amount': '감소액'
-            }, inplace=True)
-            self.stdout.write(f'Fetched {len(assets_df)} asset 레코드드') # DB에 있는 Asset 수 출력
-
-            # 2. 파일로 저장
-            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-            excel_filename = f'db_export_data_{timestamp}.xlsx' # 파일 이름 변경 (선택)
-            csv_legislators_filename = f'db_export_legislators_{timestamp}.csv' # 파일 이름 변경 (선택)
-            csv_assets_filename = f'db_export_assets_{timestamp}.csv' # 파일 이름 변경 (선택)
-
-            self.stdout.write(f'파일로 저장')
-
-            # Excel 저장
-            self.stdout.write(f'Excel로 저장 : {excel_filename}')
-            with pd.ExcelWriter(excel_filename, engine='openpyxl') as writer:
-                legislators_df.to_excel(writer, sheet_name='의원정보', index=False)
-                assets_df.to_excel(writer, sheet_name='자산정보', index=False)
-
-            # CSV 저장
-            self.stdout.write(f'CSV로 Legislator 정보 저장: {csv_legislators_filename}')
-            legislators_df.to_csv(csv_legislators_filename, index=False, encoding='utf-8-sig')
-
-            self.stdout.write(f'CSV로 Asset 정보 저장: {csv_assets_filename}')
-            assets_df.to_csv(csv_assets_filename, index=False, encoding='utf-8-sig')
-
-            self.stdout.write(self.style.SUCCESS(f'\n문제 없이 마무리'))
-
-        except Exception as e:
-            self.stderr.write(self.style.ERROR(f'Error : {e}'))
\ No newline at end of file
+        formats = list(dict.fromkeys(options['formats'])) # 중복 제거, 순서 유지
+        since = self.parse_since(options['since'])
+        chunk_size = max(options['chunk_size'], 1)
+        output_dir = options['output_dir']
+        if 'parquet' in formats: # 파일을 쓰기 시작하기 전에 확인
+            try:
+                import pyarrow  # noqa: F401
+            except ImportError:
+                raise CommandError('parquet 출력에는 pyarrow 가 필요합니다 (pip install pyarrow)')
+        os.makedirs(output_dir, exist_ok=True)
+
+        legislators_qs = Legislator.objects.order_by('member_id')
+        assets_qs = Asset.objects.order_by('id')
+        if since is not None:
+            self.stdout.write(f'{since:%Y-%m-%d %H:%M} 이후 수정된 데이터만 추출')
+            legislators_qs = legislators_qs.filter(updated_at__gte=since)
+            assets_qs = assets_qs.filter(updated_at__gte=since)
+
+        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.stdout.write(self.style.NOTICE(f"추출 시작 ({', '.join(formats)})"))
+
+        workbook = None
+        if 'xlsx' in formats:
+            from openpyxl import Workbook
+            workbook = Workbook(write_only=True)
+
+        # (라벨, 모델, queryset, 컬럼, 파일 이름, Excel 시트 이름)
+        datasets = [
+            ('Legislator', Legislator, legislators_qs, LEGISLATOR_EXPORT_COLUMNS, 'legislators', '의원정보'),
+            ('Asset', Asset, assets_qs, ASSET_EXPORT_COLUMNS, 'assets', '자산정보'),
+        ]
+        paths = []
+        for label, model, queryset, columns, file_label, sheet_name in datasets:
+            writers = []
+            try:
+                for fmt in formats:
+                    if fmt == 'xlsx':
+                        writers.append(XlsxExportWriter(workbook, sheet_name, columns))
+                        continue
+                    path = os.path.join(output_dir, f'db_export_{file_label}_{timestamp}.{fmt}')
+                    writer_class = ParquetExportWriter if fmt == 'parquet' else CsvExportWriter
+                    writers.append(writer_class(path, model, columns))
+                    paths.append(path)
+
+                total = 0
+                for rows in iter_chunks(queryset, [field for field, _ in columns], chunk_size):
+                    for writer in writers:
+                        writer.write(rows)
+                    total += len(rows)
+                    self.stdout.write(f'{label} {total}개 저장')
+            finally:
+                for writer in writers:
+                    writer.close()
+            self.stdout.write(f'{label} 레코드 {total}개 추출')
+
+        if workbook is not None:
+            excel_path = os.path.join(output_dir, f'db_export_data_{timestamp}.xlsx')
+            workbook.save(excel_path)
+            paths.append(excel_path)
+
+        for path in paths:
+            self.stdout.write(f'저장: {path}')
+        self.stdout.write(self.style.SUCCESS('\n문제 없이 마무리'))
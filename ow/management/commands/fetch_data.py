@@ -1,6 +1,8 @@
 # api 데이터 가져오기
 from django.core.management.base import BaseCommand
-from ow.services import save_legislators, save_assets, delete_status, DEFAULT_STATUS_FILE
+from ow.dashboard import refresh_after_import
+from ow.services import save_legislators, save_assets, delete_status, DEFAULT_STATUS_FILE, DEFAULT_CONCURRENCY, DEFAULT_RATE_LIMIT
+from ow.db import immediate_transactions
 
 class Command(BaseCommand):
     help = 'OpenWatch API 데이터 가져오기 및 저장'
@@ -22,6 +24,35 @@ class Command(BaseCommand):
             default=0, # 0이면 제한 없음
             help='Asset 데이터를 가져올 MAX page 수',
         )
+        parser.add_argument(
+            '--concurrency',
+            type=int,
+            default=DEFAULT_CONCURRENCY, # 1이면 기존처럼 한 페이지씩 요청
+            help='Asset 페이지를 동시에 요청할 수 (worker 수)',
+        )
+        parser.add_argument(
+            '--rate-limit',
+            type=float,
+            default=DEFAULT_RATE_LIMIT,
+            help='초당 최대 API 요청 수 (0이면 제한 없음)',
+        )
+        parser.add_argument(
+            '--output-file',
+            type=str,
+            default=None,
+            help='Asset 정보를 DB 대신 저장할 CSV 파일 경로',
+        )
+        parser.add_argument(
+            '--status-file',
+            type=str,
+            default=DEFAULT_STATUS_FILE,
+            help='페이지 진행 상황을 기록할 상태 파일 경로',
+        )
+        parser.add_argument(
+            '--incremental',
+            action='store_true',
+            help='바뀐 페이지와 의원별 최신 신고분만 저장 (변경 없는 페이지는 DB에 쓰지 않음)',
+        )
         # 상태 초기화 옵션 추가
         parser.add_argument(
             '--reset-status',
@@ -29,6 +60,7 @@ class Command(BaseCommand):
             help='저장된 데이터 무시, 상태 파일 초기화하고 처음부터 데이터 가져오기 시작',
         )
 
+    @immediate_transactions()
     def handle(self, *args, **options):
         self.stdout.write(self.style.SUCCESS("Data import 시작"))
 
@@ -37,7 +69,10 @@ class Command(BaseCommand):
         max_pages = options['max_pages']
         output_file = options['output_file']
         reset_status = options['reset_status'] # 옵션 값 읽기
-        status_file = DEFAULT_STATUS_FILE # 기본값 사용
+        concurrency = options['concurrency']
+        rate_limit = options['rate_limit']
+        incremental = options['incremental']
+        status_file = options['status_file'] # 기본값: DEFAULT_STATUS_FILE
 
         # --reset-status 옵션 처리
         if reset_status:
@@ -62,12 +97,18 @@ class Command(BaseCommand):
         if run_assets:
             self.stdout.write(f"Asset 가져오기 시작 (max pages: {'unlimited' if max_pages == 0 else max_pages})...")
             # max_pages, output_file, status_file 인자 전달
-            saved_a, updated_a, skipped_a = save_assets(max_pages=max_pages, output_file_path=output_file, status_file=status_file)
+            saved_a, updated_a, skipped_a = save_assets(max_pages=max_pages, output_file_path=output_file, status_file=status_file,
+                                                  concurrency=concurrency, rate_limit=rate_limit, incremental=incremental)
             if output_file:
                  # 파일 출력 모드에서는 saved/updated는 0, skipped만 의미 있음
                  self.stdout.write(self.style.SUCCESS(f"Asset 파일 추축 끝 "))
+            elif incremental:
+                 self.stdout.write(self.style.SUCCESS(f"Asset incremental 동기화 끝 새로 추가: {saved_a}, Updated: {updated_a}"))
             else:
                  # DB 저장 모드 결과 출력
                  self.stdout.write(self.style.SUCCESS(f"Asset 가져오기 끝 Saved: {saved_a}, Updated: {updated_a}"))
 
+        if not output_file:
+            refresh_after_import() # DB 내용이 바뀌었으므로 대시보드 집계 갱신
+
         self.stdout.write(self.style.SUCCESS("\데이터 가져오기 문제없이 완료"))
\ No newline at end of file
@@ -1,6 +1,57 @@
 import csv
+import time
+from collections import Counter
+from contextlib import nullcontext
 from django.core.management.base import BaseCommand
+from django.db import transaction
 from ow.models import Legislator, Asset
+from ow.dashboard import refresh_after_import
+from ow.services import bulk_upsert, bulk_insert_new, DEFAULT_BATCH_SIZE
+from ow.db import immediate_transactions
+
+LEGISLATOR_CSV_FIELDS = [
+    'name', 'birth', 'chi_name', 'birth_cd', 'position', 'party', 'electoral_district', 'committee',
+    'gender', 'reelected', 'latest_age', 'latest_term', 'region', 'name_chosung', 'tel', 'email', 'history', 'office',
+]
+MAX_REPORTED_ERRORS = 10 # 마지막에 보여줄 잘못된 행 / 없는 의원 ID 수
+
+
+def count_rows(filepath): # 헤더를 뺀 줄 수 (진행률용, 따옴표 안 줄바꿈이 있으면 실제 행 수보다 조금 큼)
+    lines = 0
+    last = b'\n'
+    with open(filepath, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            lines += block.count(b'\n')
+            last = block[-1:]
+    if last != b'\n': # 마지막 줄에 줄바꿈이 없음
+        lines += 1
+    return max(lines - 1, 0)
+
+
+class ProgressBar: # 한 줄을 덮어쓰는 진행 표시: Asset [######----]  60% 6,000/10,000행  12,345 rows/s
+    width = 30
+
+    def __init__(self, stdout, total, label):
+        self.stdout = stdout
+        self.total = total
+        self.label = label
+        self.started = time.monotonic()
+
+    def update(self, done):
+        ratio = min(done / self.total, 1) if self.total else 1
+        filled = int(self.width * ratio)
+        rate = done / max(time.monotonic() - self.started, 1e-6)
+        self.stdout.write(
+            f"\r{self.label} [{'#' * filled}{'-' * (self.width - filled)}] {ratio:4.0%} "
+            f"{done:,}/{max(self.total, done):,}행  {rate:,.0f} rows/s",
+            ending='',
+        )
+        self.stdout.flush()
+
+    def finish(self, done):
+        self.total = done
+        self.update(done)
+        self.stdout.write('')
 
 
 class Command(BaseCommand):
@@ -9,66 +60,128 @@ class Command(BaseCommand):
     def add_arguments(self, parser):
         parser.add_argument('--members', type=str, help='members.csv 경로')
         parser.add_argument('--assets', type=str, help='assets.csv 경로')
+        parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE, help='한 트랜잭션에 저장할 행 수')
+        parser.add_argument('--dry-run', action='store_true',
+                            help='검증만: 실제와 똑같이 처리해서 결과를 보여준 뒤 모두 되돌림 (DB 는 바뀌지 않음)')
 
+    @immediate_transactions()
     def handle(self, *args, **options):
-        if options['members']:
-            self.load_members(options['members'])
-        if options['assets']:
-            self.load_assets(options['assets'])
+        batch_size = max(options['batch_size'], 1)
+        dry_run = options['dry_run']
+        if not (options['members'] or options['assets']):
+            return
+        # dry-run 은 전체를 트랜잭션 하나로 묶어서 되돌림 (batch 트랜잭션은 savepoint 가 됨)
+        with transaction.atomic() if dry_run else nullcontext():
+            if options['members']:
+                self.load_members(options['members'], batch_size)
+            if options['assets']:
+                self.load_assets(options['assets'], batch_size)
+            if dry_run:
+                transaction.set_rollback(True)
+        if dry_run:
+            self.stdout.write(self.style.WARNING('--dry-run: 저장하지 않고 되돌렸습니다.'))
+        else:
+            refresh_after_import() # 대시보드 집계 + 페이지 캐시 갱신
+
+    def counted(self, reader): # 읽은 행 수 (진행률) 를 세면서 그대로 넘김
+        for row in reader:
+            self.read += 1
+            yield row
 
-    def load_members(self, filepath):
+    def load_members(self, filepath, batch_size=DEFAULT_BATCH_SIZE):
         self.stdout.write(f"▶ members.csv 로드 중: {filepath}")
+        self.read = 0
+        progress = ProgressBar(self.stdout, count_rows(filepath), 'Legislator')
         with open(filepath, newline='', encoding='utf-8-sig') as f:
             reader = csv.DictReader(f)
-            for row in reader:
-                legislator, created = Legislator.objects.update_or_create(
-                    member_id = row['member_id'],
-                    defaults={
-                        'name': row['name'],
-                        'birth': row.get('birth', ''),
-                        'chi_name': row['chi_name'],
-                        'birth_cd': row.get('birth_cd', ''),
-                        'position': row.get('position', ''),
-                        'party': row.get('party', ''),
-                        'electoral_district': row.get('electoral_district', ''),
-                        'committee': row.get('committee', ''),
-                        'gender': row.get('gender', ''),
-                        'reelected': row.get('reelected', ''),
-                        'electoral_district': row.get('electoral_district', ''),
-                        'latest_age': row.get('latest_age') or None,
-                        'tel': row.get('tel', ''),
-                        'email': row.get('email', ''),
-                        'history': row.get('history', ''),
-                        'office': row.get('office', ''),  
-                    } 
+            legislators = (
+                Legislator(
+                    member_id=row['member_id'],
+                    name=row['name'],
+                    birth=row.get('birth') or None,
+                    chi_name=row['chi_name'],
+                    birth_cd=row.get('birth_cd', ''),
+                    position=row.get('position', ''),
+                    party=row.get('party', ''),
+                    electoral_district=row.get('electoral_district', ''),
+                    committee=row.get('committee', ''),
+                    gender=row.get('gender', ''),
+                    reelected=row.get('reelected', ''),
+                    latest_age=row.get('latest_age') or None,
+                    latest_term=Legislator.parse_latest_term(row.get('latest_age')),
+                    region=Legislator.parse_region(row.get('electoral_district')),
+                    name_chosung=Legislator.parse_chosung(row['name']),
+                    tel=row.get('tel', ''),
+                    email=row.get('email', ''),
+                    history=row.get('history', ''),
+                    office=row.get('office', ''),
                 )
-                self.stdout.write(f" - {'생성' if created else '업데이트'}됨: {legislator.name}")
+                for row in self.counted(reader)
+            )
+            created, updated, skipped = bulk_upsert(
+                Legislator, legislators, 'member_id', LEGISLATOR_CSV_FIELDS + ['updated_at'], batch_size=batch_size,
+                on_batch=lambda *counts: progress.update(self.read),
+            )
+        progress.finish(self.read)
+        self.stdout.write(self.style.SUCCESS(f" - 의원 생성: {created}, 업데이트: {updated}, 건너뜀: {skipped}"))
 
-    def load_assets(self, filepath):
+    def load_assets(self, filepath, batch_size=DEFAULT_BATCH_SIZE):
         self.stdout.write(f"▶ assets.csv 로드 중: {filepath}")
+        self.read = 0
+        self.missing = Counter() # 없는 의원 ID -> 행 수
+        self.errors = [] # 잘못된 행 메시지
+        member_ids = set(Legislator.objects.values_list('member_id', flat=True)) # 의원 ID 는 처음 한 번만 조회
+        progress = ProgressBar(self.stdout, count_rows(filepath), 'Asset')
         with open(filepath, newline='', encoding='utf-8-sig') as f:
             reader = csv.DictReader(f)
-            for row in reader:
-                try:
-                    legislator = Legislator.objects.get(member_id=row['member_id'])
-                except Legislator.DoesNotExist:
-                    self.stdout.write(self.style.WARNING(f" ⚠ 의원 {row['member_id']} 없음"))
-                    continue
-
-                asset, created = Asset.objects.update_or_create(
-                    legislator=legislator,
-                    member_id=row['member_id'],
-                    name=row['name'],
-                    report_year=int(row['report_year']),
-                    report_month=int(row['report_month']),
-                    asset_type=row['asset_type'],
-                    relation=row['relation'],
-                    detail=row['detail'],
-                    kind=row.get('kind'),
-                    current_valuation=int(row['current_valuation'] or 0),
-                    reason_for_change=row.get('reason_for_change', ''),
-                    origin_valuation=int(row['origin_valuation'] or 0),
-                    increased_amount=int(row['increased_amount'] or 0),
-                    decreased_amount=int(row['decreased_amount'] or 0),
+            # 내용이 같은 자산(row_hash)이 이미 있으면 건너뜀 -> 같은 파일을 다시 가져와도 중복이 생기지 않음
+            created, _, skipped = bulk_insert_new(
+                Asset, self.iter_assets(reader, member_ids), 'row_hash', batch_size=batch_size,
+                on_batch=lambda *counts: progress.update(self.read),
             )
-                self.stdout.write(f" - 자산 추가됨: {asset}")
+        progress.finish(self.read)
+        self.stdout.write(self.style.SUCCESS(
+            f" - 자산 추가: {created}, 중복 건너뜀: {skipped}, "
+            f"의원 없음: {sum(self.missing.values())}, 잘못된 행: {len(self.errors)}"
+        ))
+        if self.missing:
+            ids = ', '.join(str(member_id) for member_id in list(self.missing)[:MAX_REPORTED_ERRORS])
+            more = f" 외 {len(self.missing) - MAX_REPORTED_ERRORS}명" if len(self.missing) > MAX_REPORTED_ERRORS else ''
+            self.stdout.write(self.style.WARNING(f" ⚠ 없는 의원 ID: {ids}{more}"))
+        for error in self.errors[:MAX_REPORTED_ERRORS]:
+            self.stdout.write(self.style.WARNING(f" ⚠ {error}"))
+
+    def iter_assets(self, reader, member_ids): # CSV 행을 Asset 객체로 바꿔서 하나씩 돌려줌 (의원 없는 행, 잘못된 행은 세고 건너뜀)
+        for row in self.counted(reader):
+            if row.get('member_id') not in member_ids:
+                self.missing[row.get('member_id')] += 1
+                continue
+            try:
+                asset = self.parse_asset(row)
+            except KeyError as e:
+                self.errors.append(f"{reader.line_num}행: '{e.args[0]}' 컬럼 없음")
+                continue
+            except ValueError as e:
+                self.errors.append(f"{reader.line_num}행: {e}")
+                continue
+            yield asset
+
+    def parse_asset(self, row):
+        asset = Asset(
+            legislator_id=row['member_id'],
+            member_id=row['member_id'],
+            name=row['name'],
+            report_year=int(row['report_year']),
+            report_month=int(row['report_month']),
+            asset_type=row['asset_type'],
+            relation=row['relation'],
+            detail=row['detail'],
+            kind=row.get('kind'),
+            current_valuation=int(row['current_valuation'] or 0),
+            reason_for_change=row.get('reason_for_change', ''),
+            origin_valuation=int(row['origin_valuation'] or 0),
+            increased_amount=int(row['increased_amount'] or 0),
+            decreased_amount=int(row['decreased_amount'] or 0),
+        )
+        asset.row_hash = asset.compute_row_hash()
+        return asset
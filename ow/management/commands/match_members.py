@@ -0,0 +1,56 @@
+import os
+
+import pandas as pd
+from django.core.management.base import BaseCommand, CommandError
+from ow.matching import MemberMatcher, match_file, read_csv_text
+from ow.models import Legislator
+
+DEFAULT_CHUNK_SIZE = 100000 # 대상 CSV 에서 한 번에 읽는 행 수
+
+
+class Command(BaseCommand):
+    help = '대상 CSV 의 member_id 를 의원 목록(DB 또는 --reference CSV)으로 채우고, 확인이 필요한 이름은 보고서로 저장.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('target', type=str, help='대상 CSV 경로 (name 또는 의원명 컬럼 필요)')
+        parser.add_argument('--output', type=str, help='결과 CSV 경로 (기본값: <대상>_matched.csv)')
+        parser.add_argument('--report', type=str, help='ambiguous / fuzzy / unmatched 보고서 경로 (기본값: <대상>_match_report.csv)')
+        parser.add_argument('--reference', type=str, help='참조 의원 CSV (member_id, name, ...). 없으면 DB 의 의원 목록')
+        parser.add_argument('--id-column', type=str, default='member_id', help='채울 의원 ID 컬럼 (기본값: member_id)')
+        parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE,
+                            help=f'한 번에 읽는 행 수 (기본값: {DEFAULT_CHUNK_SIZE})')
+        parser.add_argument('--no-fuzzy', action='store_true', help='이름이 정확히 같은 의원만 매칭')
+
+    def load_reference(self, path):
+        if path:
+            return read_csv_text(path)
+        fields = ['member_id', 'name', 'chi_name', 'birth', 'latest_age', 'electoral_district']
+        reference = pd.DataFrame.from_records(Legislator.objects.values_list(*fields), columns=fields)
+        if reference.empty:
+            raise CommandError('DB 에 의원이 없습니다. fetch_data 또는 import_data --members 를 먼저 실행하거나 --reference 를 지정하세요.')
+        return reference
+
+    def handle(self, *args, **options):
+        target = options['target']
+        if not os.path.exists(target):
+            raise CommandError(f'대상 파일이 없습니다: {target}')
+        base_name = os.path.splitext(target)[0]
+        output = options['output'] or f'{base_name}_matched.csv'
+        report_path = options['report'] or f'{base_name}_match_report.csv'
+
+        try:
+            matcher = MemberMatcher(self.load_reference(options['reference']), fuzzy=not options['no_fuzzy'])
+            self.stdout.write(f"▶ 참조 의원 {len(matcher.reference)}명, 대상: {target}")
+            total = match_file(matcher, target, output, options['id_column'], max(options['chunk_size'], 1))
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        report = matcher.report()
+        report.to_csv(report_path, index=False, encoding='utf-8-sig')
+        summary = matcher.summary()
+        self.stdout.write(self.style.SUCCESS(
+            f" - 전체 {total}행: 정확 {summary['exact']}, 유사 {summary['fuzzy']}, "
+            f"동명이인 {summary['ambiguous']}, 실패 {summary['unmatched']}"
+        ))
+        self.stdout.write(f"저장: {output}")
+        self.stdout.write(f"보고서 ({len(report)}개 이름): {report_path}")
@@ -1,31 +1,57 @@
 from django.core.management.base import BaseCommand
-from ow.models import Legislator, Asset 
-from django.db.models import Max, Sum
+from django.utils import timezone
+from ow.models import Asset
+from ow.dashboard import refresh_after_import
+from ow.services import recompute_total_assets, load_status, save_status, CHANGED_MEMBERS_KEY, DEFAULT_STATUS_FILE
+from ow.db import immediate_transactions
 
 class Command(BaseCommand):
     help = '의원별 최신 연월 자산 합계를 계산하여 Legislator 모델에 저장.'
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--only-changed',
+            action='store_true',
+            help='마지막 계산 이후 자산이 추가/수정/삭제된 의원만 다시 계산',
+        )
+        parser.add_argument(
+            '--status-file',
+            type=str,
+            default=DEFAULT_STATUS_FILE,
+            help='마지막 계산 시각을 기록할 상태 파일 경로',
+        )
+
+    @immediate_transactions()
     def handle(self, *args, **options):
-        count = 0
-        for legislator in Legislator.objects.all():
-            # 최신 연월 조합을 구함
-            latest_asset = (
-                Asset.objects
-                .filter(legislator=legislator)
-                .order_by('-report_year', '-report_month')
-                .values('report_year', 'report_month')
-                .first()
-            )
-            if latest_asset:
-                max_year = latest_asset['report_year']
-                max_month = latest_asset['report_month']
-                # 최신 연월의 자산 합계를 DB에 저장
-                total = (
-                    Asset.objects
-                    .filter(legislator=legislator, report_year=max_year, report_month=max_month)
-                    .exclude(asset_type='채무')
-                    .exclude(asset_type='비영리법인에 출연한 재산')
-                    .aggregate(sum=Sum('current_valuation'))['sum'] or 0
-                )
-                legislator.total_assets = total
-                legislator.save()
\ No newline at end of file
+        status_file = options['status_file']
+        started_at = timezone.now()
+        member_ids = None
+        status = load_status(status_file)
+        recorded = set(status.get(CHANGED_MEMBERS_KEY, [])) # dedupe_assets / fetch_data 에서 자산이 삭제/이동된 의원
+
+        if options['only_changed']:
+            last_run = status.get('totals_computed_at')
+            if last_run:
+                # 마지막 계산 이후 import 로 추가/수정된 자산의 의원 + 자산이 삭제/이동된 의원
+                member_ids = sorted(recorded.union(
+                    Asset.objects.filter(updated_at__gte=last_run).order_by()
+                    .values_list('legislator_id', flat=True).distinct()
+                ))
+                self.stdout.write(f"{last_run} 이후 변경된 의원 {len(member_ids)}명만 다시 계산")
+            else:
+                self.stdout.write(self.style.WARNING("마지막 계산 기록 없음 > 전체 다시 계산"))
+
+        changed = recompute_total_assets(member_ids)
+        self.stdout.write(f"총 재산이 바뀐 의원: {changed}명")
+
+        status = load_status(status_file)
+        status['totals_computed_at'] = started_at.isoformat()
+        # 계산하는 동안 새로 기록된 의원은 남겨둠
+        remaining = sorted(set(status.pop(CHANGED_MEMBERS_KEY, [])) - recorded)
+        if remaining:
+            status[CHANGED_MEMBERS_KEY] = remaining
+        save_status(status, status_file)
+
+        # 총액이 바뀌었으므로 대시보드 집계도 다시 계산
+        refresh_after_import()
+        self.stdout.write(self.style.SUCCESS("총 재산 계산 및 대시보드 갱신 완료"))
@@ -0,0 +1,248 @@
+# 의원 매칭: 참조 의원 목록(member_id, 이름, 한자명, 생년월일, 대수, 선거구)으로 대상 파일 행에 의원 ID 를 채움
+# 1) 이름으로 merge 한 뒤 대상에 있는 다른 키가 어긋나지 않는 의원이 1명이면 'exact'
+# 2) 이름이 같은 의원이 없으면 이름 편집거리 1 이내(삭제 변형 색인으로 후보를 좁힘)이면서
+#    다른 키가 하나 이상 일치하는 의원이 1명이면 'fuzzy'
+# 후보가 여럿이면 ID 를 채우지 않고 'ambiguous' 로 보고 (예전 ID_Matching 은 마지막 의원 ID 로 덮어씀)
+# 같은 키는 한 번만 풀고 결과를 기억하므로 큰 파일도 chunk 단위로 처리 가능
+# Django 없이 NotRegular_data_process / Data_Processing 스크립트에서도 사용
+import re
+from collections import Counter
+
+import pandas as pd
+
+KEY_COLUMNS = ['name', 'chi_name', 'birth', 'latest_age', 'district']
+# 파일에서 키로 인식하는 컬럼 이름 (앞에 있는 것부터)
+COLUMN_ALIASES = {
+    'name': ['name', '의원명', '이름'],
+    'chi_name': ['chi_name', '한자명'],
+    'birth': ['birth', '생년월일'],
+    'latest_age': ['latest_age', '대수'],
+    'district': ['district', 'electoral_district', '선거구'],
+}
+ID_COLUMN = 'member_id'
+
+STATUS_EXACT = 'exact'
+STATUS_FUZZY = 'fuzzy'
+STATUS_AMBIGUOUS = 'ambiguous'
+STATUS_UNMATCHED = 'unmatched'
+MATCHED_STATUSES = (STATUS_EXACT, STATUS_FUZZY)
+REPORT_COLUMNS = ['status', *KEY_COLUMNS, 'rows', 'candidates']
+
+DATE_PATTERN = re.compile(r'(\d{4})\D?(\d{2})\D?(\d{2})')
+NUMBER_PATTERN = re.compile(r'\d+')
+
+
+def find_columns(df):
+    """키 -> df 컬럼 이름 (있는 키만)"""
+    columns = {}
+    for key, aliases in COLUMN_ALIASES.items():
+        column = next((alias for alias in aliases if alias in df.columns), None)
+        if column is not None:
+            columns[key] = column
+    return columns
+
+
+def normalize_text(value): # 결측은 '', 공백은 모두 제거 ('홍 길동' == '홍길동')
+    if value is None or value != value:
+        return ''
+    return ''.join(str(value).split())
+
+
+def normalize_birth(value): # '1960.01.02', '19600102', datetime -> '1960-01-02'
+    match = DATE_PATTERN.search(normalize_text(value))
+    return '-'.join(match.groups()) if match else ''
+
+
+def normalize_ages(value): # '21, 22' / '22대' -> '21,22'
+    ages = {int(number) for number in NUMBER_PATTERN.findall(normalize_text(value))}
+    return ','.join(str(age) for age in sorted(ages))
+
+
+NORMALIZERS = {
+    'name': normalize_text,
+    'chi_name': normalize_text,
+    'birth': normalize_birth,
+    'latest_age': normalize_ages,
+    'district': normalize_text,
+}
+
+
+def normalize_keys(df, columns):
+    """키 컬럼을 정규화한 DataFrame (컬럼 이름은 KEY_COLUMNS, 대상에 없는 키는 '')"""
+    keys = pd.DataFrame(index=df.index)
+    for key in KEY_COLUMNS:
+        keys[key] = df[columns[key]].map(NORMALIZERS[key]) if key in columns else ''
+    return keys.astype(object)
+
+
+def ages_overlap(left, right): # 한쪽이라도 모르면 어긋나지 않음
+    return not left or not right or not set(left.split(',')).isdisjoint(right.split(','))
+
+
+def within_one_edit(left, right): # 편집거리(삽입/삭제/치환) 1 이하
+    if abs(len(left) - len(right)) > 1:
+        return False
+    if len(left) > len(right):
+        left, right = right, left
+    i = 0
+    while i < len(left) and left[i] == right[i]:
+        i += 1
+    if len(left) == len(right):
+        return left[i + 1:] == right[i + 1:]
+    return left[i:] == right[i + 1:]
+
+
+def deletion_variants(name): # 이름 자신 + 한 글자씩 뺀 문자열 (편집거리 1 이내 후보 블로킹)
+    return {name} | {name[:i] + name[i + 1:] for i in range(len(name))}
+
+
+def compare_pairs(pairs):
+    """
+    (대상 키, 참조 키_ref) 쌍마다 어긋나지 않는지(ok)와 양쪽에 다 있고 같은 키 수(agree).
+    이름 외 키는 한쪽이 비어 있으면 판단하지 않음.
+    """
+    ok = pd.Series(True, index=pairs.index)
+    agree = pd.Series(0, index=pairs.index)
+    for key in ['chi_name', 'birth', 'district']:
+        known = pairs[key].ne('') & pairs[f'{key}_ref'].ne('')
+        same = pairs[key].eq(pairs[f'{key}_ref'])
+        ok &= ~known | same
+        agree += known & same
+    ages_known = pairs['latest_age'].ne('') & pairs['latest_age_ref'].ne('')
+    ages_ok = pd.Series([ages_overlap(left, right) for left, right in zip(pairs['latest_age'], pairs['latest_age_ref'])],
+                        index=pairs.index, dtype=bool)
+    ok &= ages_ok
+    agree += ages_known & ages_ok
+    return ok, agree
+
+
+class MemberMatcher:
+    """
+    참조 의원 목록 색인. match() 를 chunk 마다 불러도 되고, 결과와 보고서는 누적됨.
+
+        matcher = MemberMatcher(reference_df)
+        matched = matcher.match(target_df)
+        matcher.report() # ambiguous / fuzzy / unmatched 키 목록
+    """
+
+    def __init__(self, reference, fuzzy=True):
+        columns = find_columns(reference)
+        if 'name' not in columns or ID_COLUMN not in reference.columns:
+            raise ValueError(f"참조 데이터에 이름 또는 '{ID_COLUMN}' 컬럼이 없습니다.")
+        keys = normalize_keys(reference, columns)
+        keys[ID_COLUMN] = reference[ID_COLUMN].map(normalize_text)
+        self.reference = keys[keys['name'].ne('') & keys[ID_COLUMN].ne('')].reset_index(drop=True)
+        self.fuzzy = fuzzy
+        self.variants = {} # 삭제 변형 -> 참조 행 번호 목록
+        for position, name in enumerate(self.reference['name']):
+            for variant in deletion_variants(name):
+                self.variants.setdefault(variant, []).append(position)
+        self.resolved = {} # 키 tuple -> (상태, ID, 후보 ID tuple)
+        self.row_counts = Counter() # 키 tuple -> 대상 행 수
+
+    def match(self, target, id_column=ID_COLUMN):
+        """target 사본의 id_column 을 채워서 돌려줌 (exact / fuzzy 만, 나머지 행은 원래 값 유지)"""
+        columns = find_columns(target)
+        if 'name' not in columns:
+            raise ValueError("대상 데이터에 이름 컬럼이 없습니다.")
+        result = target.copy()
+        if id_column not in result.columns:
+            result[id_column] = ''
+        if result.empty:
+            return result
+
+        raw_columns = list(columns.values())
+        raw = target[raw_columns].reset_index(drop=True)
+        unique = raw.drop_duplicates().reset_index(drop=True) # 같은 의원 행은 한 번만 정규화/매칭
+        keys = normalize_keys(unique, columns)
+        key_tuples = list(keys[KEY_COLUMNS].itertuples(index=False, name=None))
+        new = [position for position, key in enumerate(key_tuples) if key not in self.resolved]
+        if new:
+            self.resolve(keys.iloc[new].drop_duplicates())
+
+        resolved = [self.resolved[key] for key in key_tuples]
+        unique['_id'] = [member_id if status in MATCHED_STATUSES else None for status, member_id, _ in resolved]
+        unique['_key'] = key_tuples
+        merged = raw.assign(_position=range(len(raw))).merge(unique, on=raw_columns, how='left', sort=False)
+        merged = merged.sort_values('_position')
+        self.row_counts.update(merged['_key'].tolist())
+
+        member_ids = pd.Series(merged['_id'].to_numpy(), index=result.index)
+        result[id_column] = result[id_column].astype(object).where(member_ids.isna(), member_ids)
+        return result
+
+    def resolve(self, keys):
+        """새 키들(정규화, 중복 없음)의 매칭 결과를 self.resolved 에 저장"""
+        reference = self.reference.add_suffix('_ref')
+        keys = keys.reset_index(drop=True)
+
+        # 1) 이름이 같은 의원 (merge)
+        pairs = keys.merge(reference, left_on='name', right_on='name_ref', how='inner')
+        ok, _ = compare_pairs(pairs)
+        pairs = pairs[ok]
+        exact = pairs.groupby(KEY_COLUMNS, sort=False)[f'{ID_COLUMN}_ref'].unique()
+        for key, member_ids in exact.items():
+            status = STATUS_EXACT if len(member_ids) == 1 else STATUS_AMBIGUOUS
+            self.resolved[key] = (status, member_ids[0] if status == STATUS_EXACT else None, tuple(member_ids))
+
+        # 2) 남은 키는 이름 편집거리 1 이내 후보 중 다른 키가 일치하는 의원
+        rest = keys[[key not in self.resolved for key in keys[KEY_COLUMNS].itertuples(index=False, name=None)]]
+        candidates = []
+        if self.fuzzy:
+            for position, name in rest['name'].items():
+                nearby = {ref for variant in deletion_variants(name) for ref in self.variants.get(variant, ())}
+                candidates += [(position, ref) for ref in sorted(nearby)
+                               if within_one_edit(name, self.reference.at[ref, 'name'])]
+        pairs = pd.DataFrame(candidates, columns=['_key', '_ref'])
+        pairs = pd.concat([
+            keys.loc[pairs['_key']].reset_index(drop=True),
+            reference.loc[pairs['_ref']].reset_index(drop=True),
+        ], axis=1)
+        ok, agree = compare_pairs(pairs) if len(pairs) else (pd.Series(dtype=bool), pd.Series(dtype=int))
+        close = pairs[ok].groupby(KEY_COLUMNS, sort=False)[f'{ID_COLUMN}_ref'].unique()
+        corroborated = pairs[ok & agree.ge(1)].groupby(KEY_COLUMNS, sort=False)[f'{ID_COLUMN}_ref'].unique()
+        for key in rest[KEY_COLUMNS].itertuples(index=False, name=None):
+            member_ids = corroborated.get(key)
+            if member_ids is not None and len(member_ids) == 1:
+                self.resolved[key] = (STATUS_FUZZY, member_ids[0], tuple(member_ids))
+            elif member_ids is not None:
+                self.resolved[key] = (STATUS_AMBIGUOUS, None, tuple(member_ids))
+            else: # 비슷한 이름이 있어도 다른 키로 확인되지 않으면 채우지 않고 후보만 보고
+                self.resolved[key] = (STATUS_UNMATCHED, None, tuple(close.get(key, ())))
+
+    def summary(self):
+        """상태 -> 대상 행 수"""
+        counts = Counter()
+        for key, rows in self.row_counts.items():
+            counts[self.resolved[key][0]] += rows
+        return {status: counts[status] for status in (*MATCHED_STATUSES, STATUS_AMBIGUOUS, STATUS_UNMATCHED)}
+
+    def report(self, statuses=(STATUS_AMBIGUOUS, STATUS_FUZZY, STATUS_UNMATCHED)):
+        """확인이 필요한 키 목록 (상태, 키, 대상 행 수, 후보 ID), 상태별로 행 수가 많은 것부터"""
+        records = [
+            (status, *key, self.row_counts[key], ';'.join(map(str, candidates)))
+            for key, (status, _, candidates) in self.resolved.items()
+            if status in statuses and self.row_counts[key]
+        ]
+        report = pd.DataFrame(records, columns=REPORT_COLUMNS)
+        order = {status: index for index, status in enumerate(statuses)}
+        report['_order'] = report['status'].map(order)
+        report = report.sort_values(['_order', 'rows', 'name'], ascending=[True, False, True], kind='stable')
+        return report.drop(columns='_order').reset_index(drop=True)
+
+
+def read_csv_text(path, **kwargs): # 모든 값을 문자열로 ('' 은 그대로) -> 다시 쓸 때 값이 바뀌지 않음
+    return pd.read_csv(path, dtype=str, keep_default_na=False, encoding='utf-8-sig', **kwargs)
+
+
+def match_file(matcher, input_path, output_path, id_column=ID_COLUMN, chunksize=100000):
+    """CSV 를 chunksize 행씩 읽어서 매칭 후 이어 씀. 처리한 행 수를 돌려줌"""
+    total = 0
+    for number, chunk in enumerate(read_csv_text(input_path, chunksize=chunksize)):
+        matched = matcher.match(chunk, id_column)
+        matched.to_csv(output_path, mode='w' if number == 0 else 'a', header=number == 0, index=False,
+                       encoding='utf-8-sig' if number == 0 else 'utf-8')
+        total += len(chunk)
+    if total == 0: # 헤더만 있는 파일
+        matcher.match(read_csv_text(input_path), id_column).to_csv(output_path, index=False, encoding='utf-8-sig')
+    return total
@@ -0,0 +1,19 @@
+# Generated by Django 5.2 on 2026-10-18 08:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ow', '0002_legislator_total_assets'),
+    ]
+
+    # OpenWatch 자산 ID (bulk upsert 기준 키)
+    operations = [
+        migrations.AddField(
+            model_name='asset',
+            name='openwatch_asset_id',
+            field=models.BigIntegerField(blank=True, help_text="OpenWatch API asset ID (API 'id', upsert 기준)", null=True, unique=True),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.2 on 2026-10-18 08:55
+
+import re
+
+from django.db import migrations, models
+
+
+def fill_latest_term(apps, schema_editor): # 기존 의원의 latest_age 로 latest_term 채우기
+    Legislator = apps.get_model('ow', 'Legislator')
+    legislators = list(Legislator.objects.only('member_id', 'latest_age'))
+    for legislator in legislators:
+        terms = [int(t) for t in re.findall(r'\d+', legislator.latest_age or '')]
+        legislator.latest_term = max(terms) if terms else None
+    Legislator.objects.bulk_update(legislators, ['latest_term'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ow', '0004_dashboardsnapshot'),
+    ]
+
+    # latest_age__contains='22대' (LIKE 검색) 대신 쓰는 최근 대수 컬럼 (인덱스는 0006 의 복합 인덱스)
+    operations = [
+        migrations.AddField(
+            model_name='legislator',
+            name='latest_term',
+            field=models.IntegerField(blank=True, help_text='latest_age 중 가장 최근 대수 (예: 22)', null=True),
+        ),
+        migrations.RunPython(fill_latest_term, migrations.RunPython.noop),
+    ]
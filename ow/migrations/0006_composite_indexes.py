@@ -0,0 +1,38 @@
+# Generated by Django 5.2 on 2026-10-18 08:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ow', '0005_legislator_latest_term'),
+    ]
+
+    # 실제 조회 경로(대시보드, 의원 목록, 의원 상세, 총 재산 계산)에 맞춘 복합 인덱스
+    operations = [
+        migrations.AddIndex(
+            model_name='asset',
+            index=models.Index(fields=['legislator', 'report_year', 'report_month', 'asset_type', 'current_valuation'], name='asset_member_period_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='legislator',
+            index=models.Index(fields=['latest_term', '-total_assets'], name='leg_term_assets_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='legislator',
+            index=models.Index(fields=['latest_term', 'party', '-total_assets'], name='leg_term_party_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='legislator',
+            index=models.Index(fields=['-total_assets', 'member_id'], name='leg_assets_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='legislator',
+            index=models.Index(fields=['party', 'name'], name='leg_party_name_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='legislator',
+            index=models.Index(fields=['electoral_district'], name='leg_district_idx'),
+        ),
+    ]
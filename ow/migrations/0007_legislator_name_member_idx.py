@@ -0,0 +1,18 @@
+# Generated by Django 5.2 on 2026-10-18 09:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ow', '0006_composite_indexes'),
+    ]
+
+    # 이름순 의원 목록을 (name, member_id) 커서로 읽기 위한 인덱스
+    operations = [
+        migrations.AddIndex(
+            model_name='legislator',
+            index=models.Index(fields=['name', 'member_id'], name='leg_name_member_idx'),
+        ),
+    ]
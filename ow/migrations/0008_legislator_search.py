@@ -0,0 +1,64 @@
+# Generated by Django 5.2 on 2026-10-18 09:03
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+CHOSUNG = 'ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ'
+SEARCH_FIELDS = ['name', 'chi_name', 'party', 'electoral_district']
+
+
+def fill_search_fields(apps, schema_editor): # 기존 의원의 region, name_chosung, 검색 색인 채우기
+    Legislator = apps.get_model('ow', 'Legislator')
+    LegislatorSearchToken = apps.get_model('ow', 'LegislatorSearchToken')
+    legislators = list(Legislator.objects.only('member_id', *SEARCH_FIELDS))
+    tokens = []
+    for legislator in legislators:
+        words = (legislator.electoral_district or '').split()
+        legislator.region = words[0] if len(words) > 1 else None
+        chosung = []
+        for char in (legislator.name or '').replace(' ', ''):
+            code = ord(char) - 0xAC00
+            chosung.append(CHOSUNG[code // 588] if 0 <= code <= 11171 else char.lower())
+        legislator.name_chosung = ''.join(chosung)
+
+        grams = set()
+        for field in SEARCH_FIELDS:
+            text = ''.join((getattr(legislator, field) or '').split()).lower()
+            grams.update(text)
+            grams.update(text[i:i + 2] for i in range(len(text) - 1))
+        tokens.extend(LegislatorSearchToken(legislator_id=legislator.member_id, token=gram) for gram in grams)
+    Legislator.objects.bulk_update(legislators, ['region', 'name_chosung'], batch_size=500)
+    LegislatorSearchToken.objects.bulk_create(tokens, batch_size=2000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ow', '0007_legislator_name_member_idx'),
+    ]
+
+    # 의원 검색: 지역 컬럼(요청마다 선거구 문자열을 나누지 않도록), 초성 컬럼, n-gram 색인 테이블
+    operations = [
+        migrations.AddField(
+            model_name='legislator',
+            name='name_chosung',
+            field=models.CharField(blank=True, db_index=True, help_text='이름 초성 (예: ㅎㄱㄷ)', max_length=50, null=True),
+        ),
+        migrations.AddField(
+            model_name='legislator',
+            name='region',
+            field=models.CharField(blank=True, db_index=True, help_text='선거구 첫 단어 (예: 서울)', max_length=20, null=True),
+        ),
+        migrations.CreateModel(
+            name='LegislatorSearchToken',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('token', models.CharField(max_length=2)),
+                ('legislator', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='search_tokens', to='ow.legislator')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('token', 'legislator'), name='search_token_unique')],
+            },
+        ),
+        migrations.RunPython(fill_search_fields, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,62 @@
+# Generated by Django 5.2 on 2026-10-18 09:34
+
+import hashlib
+
+from django.db import migrations, models
+
+BATCH_SIZE = 2000
+
+
+def row_hash(asset): # Asset.make_row_hash 와 같은 계산 (마이그레이션의 모델에는 메서드가 없음)
+    values = [
+        asset.legislator_id, asset.report_year, asset.report_month, asset.asset_type, asset.relation, asset.kind,
+        ' '.join(str(asset.detail or '').split()),
+        *(value or 0 for value in (asset.current_valuation, asset.origin_valuation,
+                                   asset.increased_amount, asset.decreased_amount)),
+    ]
+    text = '\x1f'.join('' if value is None else str(value) for value in values)
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def fill_row_hash(apps, schema_editor):
+    """
+    기존 자산의 row_hash 채우기. 같은 내용이 여러 행이면 OpenWatch ID 가 있는 행, 그다음 먼저 저장된 행만 채우고
+    나머지는 NULL 로 둠 (고유 인덱스에 걸리지 않음, dedupe_assets 로 정리)
+    OpenWatch ID 가 있는 행 -> 없는 행 순서로, 각각 id 범위 batch 로 읽고 저장 (읽는 중인 커서로 같은 테이블을 갱신하지 않음)
+    """
+    Asset = apps.get_model('ow', 'Asset')
+    seen = set()
+    for has_openwatch_id in (True, False):
+        assets = Asset.objects.filter(openwatch_asset_id__isnull=not has_openwatch_id).order_by('id')
+        last_id = 0
+        while True:
+            batch = list(assets.filter(id__gt=last_id)[:BATCH_SIZE])
+            if not batch:
+                break
+            last_id = batch[-1].id
+            filled = []
+            for asset in batch:
+                value = row_hash(asset)
+                if value in seen:
+                    continue
+                seen.add(value)
+                asset.row_hash = value
+                filled.append(asset)
+            Asset.objects.bulk_update(filled, ['row_hash'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ow', '0008_legislator_search'),
+    ]
+
+    # 자산 내용 해시 컬럼 추가 후 기존 행 채우기 (고유 인덱스는 0010 에서, 채운 뒤에 만들어야 빠름)
+    operations = [
+        migrations.AddField(
+            model_name='asset',
+            name='row_hash',
+            field=models.CharField(blank=True, editable=False, help_text='의원, 연월, 구분, 관계, 종류, 명세(공백 정리), 가액들의 해시 (compute_row_hash)', max_length=32, null=True),
+        ),
+        migrations.RunPython(fill_row_hash, migrations.RunPython.noop),
+    ]
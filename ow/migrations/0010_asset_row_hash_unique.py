@@ -0,0 +1,19 @@
+# Generated by Django 5.2 on 2026-10-18 09:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ow', '0009_asset_row_hash'),
+    ]
+
+    # row_hash 고유 인덱스 (중복 행은 NULL 이라 걸리지 않음)
+    operations = [
+        migrations.AlterField(
+            model_name='asset',
+            name='row_hash',
+            field=models.CharField(blank=True, editable=False, help_text='의원, 연월, 구분, 관계, 종류, 명세(공백 정리), 가액들의 해시 (compute_row_hash)', max_length=32, null=True, unique=True),
+        ),
+    ]
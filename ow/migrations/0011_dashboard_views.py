@@ -0,0 +1,51 @@
+# Generated by Django 5.2 on 2026-10-18 12:10
+
+from django.db import migrations
+
+# compute_dashboard 의 지역별 / 정당별 자산 합계와 같은 집계 (대수별, 비례대표는 지역에서 제외)
+# REFRESH ... CONCURRENTLY 에는 고유 인덱스가 필요
+CREATE_VIEWS = [
+    """
+    CREATE MATERIALIZED VIEW ow_region_assets AS
+    SELECT latest_term, LEFT(electoral_district, 2) AS group_key, SUM(total_assets)::bigint AS total_assets
+    FROM ow_legislator
+    WHERE latest_term IS NOT NULL AND electoral_district IS NOT NULL AND electoral_district NOT LIKE '비례%'
+    GROUP BY latest_term, LEFT(electoral_district, 2)
+    """,
+    "CREATE UNIQUE INDEX ow_region_assets_key ON ow_region_assets (latest_term, group_key)",
+    """
+    CREATE MATERIALIZED VIEW ow_party_assets AS
+    SELECT latest_term, party AS group_key, SUM(total_assets)::bigint AS total_assets
+    FROM ow_legislator
+    WHERE latest_term IS NOT NULL AND party IS NOT NULL
+    GROUP BY latest_term, party
+    """,
+    "CREATE UNIQUE INDEX ow_party_assets_key ON ow_party_assets (latest_term, group_key)",
+]
+DROP_VIEWS = [
+    "DROP MATERIALIZED VIEW IF EXISTS ow_region_assets",
+    "DROP MATERIALIZED VIEW IF EXISTS ow_party_assets",
+]
+
+
+def run_on_postgres(statements):
+    def run(apps, schema_editor):
+        if schema_editor.connection.vendor != 'postgresql': # SQLite 는 스냅샷(DashboardSnapshot) 만 사용
+            return
+        # schema_editor.execute 는 SQL 을 placeholder 처리(mogrify) 하므로 LIKE '비례%' 가 그대로 가도록 cursor 로 실행
+        with schema_editor.connection.cursor() as cursor:
+            for sql in statements:
+                cursor.execute(sql)
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ow', '0010_asset_row_hash_unique'),
+    ]
+
+    # PostgreSQL 에서만 대시보드 합계 materialized view 생성 (import 후 ow.db.refresh_dashboard_views 로 갱신)
+    operations = [
+        migrations.RunPython(run_on_postgres(CREATE_VIEWS), run_on_postgres(DROP_VIEWS)),
+    ]
@@ -1,4 +1,31 @@
+import hashlib
+import re
 from django.db import models
+from django.db.models import F, Window
+from django.db.models.functions import RowNumber
+
+CURRENT_TERM = 22 # 대시보드 등에서 기준으로 삼는 현재 국회 대수
+CHOSUNG = 'ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ' # 한글 초성 19자 (유니코드 음절 순서)
+
+
+class LegislatorQuerySet(models.QuerySet):
+    def current(self): # 현재 대수(22대) 의원만 (latest_term 인덱스 사용)
+        return self.filter(latest_term=CURRENT_TERM)
+
+    def top_n_per_group(self, field, n, order_by=('-total_assets', 'member_id')):
+        """그룹(field)마다 order_by 기준 상위 n 명을 한 번의 쿼리로 가져옴
+
+        field 는 필드 이름 또는 식(예: Left('electoral_district', 2)).
+        결과 객체에는 group_key(그룹 값), group_rank(그룹 내 순위, 1부터) 가 붙음.
+        ROW_NUMBER() OVER (PARTITION BY ...) 로 계산하므로 그룹 수와 상관없이 쿼리는 1번.
+        """
+        group = F(field) if isinstance(field, str) else field
+        ordering = [F(o[1:]).desc() if o.startswith('-') else F(o).asc() for o in order_by]
+        return self.annotate(
+            group_key=group,
+            group_rank=Window(RowNumber(), partition_by=[group], order_by=ordering),
+        ).filter(group_rank__lte=n).order_by('group_key', 'group_rank')
+
 
 class Legislator(models.Model):
     """국회의원 정보를 저장하는 모델 (/members API 기반)"""
@@ -18,6 +45,9 @@ class Legislator(models.Model):
     electoral_district = models.CharField(max_length=100, blank=True, null=True) # 선거구
     committee = models.CharField(max_length=100, blank=True, null=True) # 위원회
     latest_age = models.CharField(null=True, blank=True, help_text="활동 회기 (API 'latestAge')") # 예시: 21 또는 22
+    latest_term = models.IntegerField(null=True, blank=True, help_text="latest_age 중 가장 최근 대수 (예: 22)")
+    region = models.CharField(max_length=20, blank=True, null=True, db_index=True, help_text="선거구 첫 단어 (예: 서울)")
+    name_chosung = models.CharField(max_length=50, blank=True, null=True, db_index=True, help_text="이름 초성 (예: ㅎㄱㄷ)")
     gender = models.CharField(max_length=10, blank=True, null=True, help_text="성별 (API 'gender')") # 성별
     reelected = models.CharField(max_length=50, blank=True, null=True, help_text="재선여부 (API 'reelected')") # 재선 여부
     tel = models.CharField(max_length=20, blank=True, null=True) # 전화번호
@@ -29,9 +59,57 @@ class Legislator(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = LegislatorQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            # 대시보드: 현재 대수 의원을 재산순으로 (상위 20명, 지역별 상위 5명)
+            models.Index(fields=['latest_term', '-total_assets'], name='leg_term_assets_idx'),
+            # 대시보드: 정당별 합계 / 정당별 상위 5명
+            models.Index(fields=['latest_term', 'party', '-total_assets'], name='leg_term_party_idx'),
+            # 의원 목록: 재산순 정렬
+            models.Index(fields=['-total_assets', 'member_id'], name='leg_assets_idx'),
+            # 의원 목록: 이름순 정렬 (커서 페이지네이션 키)
+            models.Index(fields=['name', 'member_id'], name='leg_name_member_idx'),
+            # 의원 목록: 정당 필터 + 이름순, 정당 드롭박스
+            models.Index(fields=['party', 'name'], name='leg_party_name_idx'),
+            # 의원 목록: 지역 필터, 지역 드롭박스
+            models.Index(fields=['electoral_district'], name='leg_district_idx'),
+        ]
+
     def __str__(self):
         return f"{self.name} ({self.party or '정보 없음'})"
 
+    def save(self, *args, **kwargs):
+        self.fill_derived_fields()
+        super().save(*args, **kwargs)
+
+    def fill_derived_fields(self): # latest_age/선거구/이름에서 계산하는 필드 (bulk 저장은 save() 를 거치지 않으므로 직접 호출)
+        self.latest_term = self.parse_latest_term(self.latest_age)
+        self.region = self.parse_region(self.electoral_district)
+        self.name_chosung = self.parse_chosung(self.name)
+
+    # 'latest_age' 문자열에서 가장 최근 대수 추출
+    @staticmethod
+    def parse_latest_term(latest_age):    # '제20대, 제22대' -> 22, '22' -> 22, 없으면 None
+        terms = [int(t) for t in re.findall(r'\d+', str(latest_age or ''))]
+        return max(terms) if terms else None
+
+    # 선거구에서 시/도 추출 (의원 목록 지역 필터/드롭박스)
+    @staticmethod
+    def parse_region(electoral_district):    # '서울 종로구' -> '서울', '비례대표' -> None
+        words = (electoral_district or '').split()
+        return words[0] if len(words) > 1 else None
+
+    # 이름 초성 (초성 검색용)
+    @staticmethod
+    def parse_chosung(name):    # '홍길동' -> 'ㅎㄱㄷ', 한글이 아닌 글자는 소문자로 그대로
+        chars = []
+        for char in (name or '').replace(' ', ''):
+            code = ord(char) - 0xAC00
+            chars.append(CHOSUNG[code // 588] if 0 <= code <= 11171 else char.lower())
+        return ''.join(chars)
+
 class Asset(models.Model):
     """국회의원 자산 상세 항목 정보를 저장하는 모델 (/assets API 기반)"""
     # 연결 정보
@@ -44,6 +122,12 @@ class Asset(models.Model):
 
     # OpenWatch API 데이터 기반 필드
     # API 응답의 'id' 필드 (자산 항목 자체의 고유 ID)
+    openwatch_asset_id = models.BigIntegerField(
+        unique=True,
+        null=True, # CSV로 들어온 자산은 API ID가 없음
+        blank=True,
+        help_text="OpenWatch API asset ID (API 'id', upsert 기준)"
+    )
     member_id = models.CharField(
         max_length=20,
         help_text="OpenWatch API member ID (고유 식별자)"
@@ -63,12 +147,55 @@ class Asset(models.Model):
     increased_amount = models.BigIntegerField(null=True, blank=True, help_text="증가액 (API 'increasedAmount')")
     decreased_amount = models.BigIntegerField(null=True, blank=True, help_text="감소액 (API 'decreasedAmount')")
 
+    # 내용 해시 (같은 자산이 두 번 저장되지 않도록 고유 인덱스, 저장/가져오기 때 한 번의 인덱스 조회로 중복 확인)
+    row_hash = models.CharField(
+        max_length=32,
+        unique=True,
+        null=True, # 마이그레이션 전에 이미 중복이던 행 (dedupe_assets 로 정리)
+        blank=True,
+        editable=False,
+        help_text="의원, 연월, 구분, 관계, 종류, 명세(공백 정리), 가액들의 해시 (compute_row_hash)"
+    )
+
     # 부가 정보
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ['-report_year', '-report_month', 'legislator__name', 'asset_type'] # 최신순, 의원 이름 순 정렬
+        indexes = [
+            # 의원 상세(의원별 최신순 목록)와 총 재산 계산(의원 + 연월, 자산구분 제외 후 현재가액 합계)에 같이 사용
+            # 합계에 필요한 컬럼까지 포함해서 테이블을 읽지 않고 인덱스만으로 처리
+            models.Index(
+                fields=['legislator', 'report_year', 'report_month', 'asset_type', 'current_valuation'],
+                name='asset_member_period_idx',
+            ),
+        ]
+
+    def save(self, *args, **kwargs):
+        row_hash = self.compute_row_hash()
+        if self.pk and self.row_hash is None and Asset.objects.filter(row_hash=row_hash).exclude(pk=self.pk).exists():
+            # 0009 마이그레이션 전부터 다른 행과 중복인 행: 해시 없이 저장 (고유 인덱스 오류 대신 dedupe_assets 로 정리)
+            row_hash = None
+        self.row_hash = row_hash
+        super().save(*args, **kwargs)
+
+    def compute_row_hash(self): # bulk_create 는 save() 를 거치지 않으므로 만들 때 직접 채움
+        return self.make_row_hash(
+            self.legislator_id, self.report_year, self.report_month, self.asset_type, self.relation, self.kind,
+            self.detail, self.current_valuation, self.origin_valuation, self.increased_amount, self.decreased_amount,
+        )
+
+    @staticmethod
+    def make_row_hash(member_id, report_year, report_month, asset_type, relation, kind, detail, *valuations):
+        """자산 내용 -> 32자 hex 해시. 명세는 공백을 정리하고, 없는 가액(None)은 0 과 같게 봄 (내보내기 -> 가져오기 후에도 같은 값)"""
+        values = [
+            member_id, report_year, report_month, asset_type, relation, kind,
+            ' '.join(str(detail or '').split()),
+            *(value or 0 for value in valuations),
+        ]
+        text = '\x1f'.join('' if value is None else str(value) for value in values)
+        return hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
 
     def __str__(self):
         formatted_value = "{:,}".format(self.current_valuation) if self.current_valuation is not None else "N/A"
@@ -84,4 +211,26 @@ class Asset(models.Model):
                 return year, month
             except ValueError:
                 return None, None
-        return None, None
\ No newline at end of file
+        return None, None
+
+class DashboardSnapshot(models.Model):
+    """main_page 대시보드 집계(지역/정당별 합계, 상위 의원)를 미리 계산해 저장하는 모델"""
+    data = models.JSONField(help_text="ow.dashboard.compute_dashboard() 결과")
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    def __str__(self):
+        return f"DashboardSnapshot ({self.created_at:%Y-%m-%d %H:%M})"
+
+class LegislatorSearchToken(models.Model):
+    """의원 검색용 n-gram 색인 (이름/한자 이름/정당/선거구의 1글자, 2글자 조각 -> 의원)"""
+    legislator = models.ForeignKey(Legislator, on_delete=models.CASCADE, related_name='search_tokens')
+    token = models.CharField(max_length=2)
+
+    class Meta:
+        constraints = [
+            # token 으로 찾는 색인을 겸함
+            models.UniqueConstraint(fields=['token', 'legislator'], name='search_token_unique'),
+        ]
+
+    def __str__(self):
+        return f"{self.token} -> {self.legislator_id}"
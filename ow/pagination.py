@@ -0,0 +1,167 @@
+# 키셋(커서) 페이지네이션: OFFSET 대신 이전 페이지 마지막 행의 정렬 키 다음부터 읽음
+import base64
+import hashlib
+import json
+import math
+
+from django.core.cache import cache
+from django.db.models import F, Q
+from django.utils.functional import cached_property
+
+from ow.cache import get_data_version
+
+COUNT_CACHE_TIMEOUT = 60 * 60 # 전체 개수 캐시 시간(초), import 로 데이터 버전이 바뀌면 새로 셈
+
+
+def encode_cursor(data): # dict -> URL 에 넣을 수 있는 문자열
+    raw = json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor): # 잘못된 커서는 None (-> 페이지 번호 방식으로 처리)
+    if not cursor:
+        return None
+    try:
+        data = json.loads(base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)))
+    except (ValueError, TypeError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
+class KeysetPaginator:
+    """
+    ordering 순서(마지막 필드는 유일해야 함)로 queryset 을 per_page 개씩 자름.
+    이전/다음 페이지는 커서(정렬 키)로 읽고, 페이지 번호로 바로 이동할 때만 OFFSET 사용.
+    null 값은 정방향 기준 항상 맨 뒤로 정렬.
+    """
+    def __init__(self, queryset, per_page, ordering):
+        self.queryset = queryset
+        self.per_page = per_page
+        self.ordering = list(ordering)
+        self.fields = [(field.lstrip('-'), field.startswith('-')) for field in self.ordering]
+        self.nullable = {name: queryset.model._meta.get_field(name).null for name, _ in self.fields}
+
+    @cached_property
+    def count(self): # 10페이지 단위 UI 용 전체 개수, 같은 쿼리는 데이터 버전 단위로 캐시
+        digest = hashlib.sha1(str(self.queryset.query).encode('utf-8')).hexdigest()
+        key = f"ow:count:{get_data_version()}:{digest}"
+        return cache.get_or_set(key, self.queryset.count, COUNT_CACHE_TIMEOUT)
+
+    @cached_property
+    def num_pages(self):
+        return max(1, math.ceil(self.count / self.per_page))
+
+    def order_by(self, reverse=False):
+        expressions = []
+        for name, desc in self.fields:
+            if reverse:
+                desc = not desc
+            nulls = {}
+            if self.nullable[name]: # null 위치를 DB 와 상관없이 고정
+                nulls = {'nulls_first': True} if reverse else {'nulls_last': True}
+            expressions.append(F(name).desc(**nulls) if desc else F(name).asc(**nulls))
+        return expressions
+
+    def keyset_filter(self, values, after=True): # 정렬 키 values 의 다음(after) / 이전 행 조건
+        condition = Q(pk__in=[]) # 항상 거짓
+        equal = Q()
+        for (name, desc), value in zip(self.fields, values):
+            if value is None:
+                # null 은 맨 뒤: 뒤에는 같은 null 만, 앞에는 null 이 아닌 값 전부
+                if not after:
+                    condition |= equal & Q(**{f"{name}__isnull": False})
+                equal &= Q(**{f"{name}__isnull": True})
+                continue
+            lookup = 'lt' if desc == after else 'gt'
+            step = Q(**{f"{name}__{lookup}": value})
+            if after and self.nullable[name]:
+                step |= Q(**{f"{name}__isnull": True})
+            condition |= equal & step
+            equal &= Q(**{name: value})
+        return condition
+
+    def key_of(self, obj):
+        return [getattr(obj, name) for name, _ in self.fields]
+
+    @staticmethod
+    def parse_number(number): # 페이지 번호 (1 이상), 잘못된 값은 1
+        try:
+            return max(int(number), 1)
+        except (TypeError, ValueError):
+            return 1
+
+    def validate_number(self, number): # 페이지 번호를 전체 페이지 수 안으로 (1페이지가 아니면 COUNT 필요)
+        number = self.parse_number(number)
+        return number if number == 1 else min(number, self.num_pages)
+
+    def get_page(self, number=None, cursor=None):
+        data = decode_cursor(cursor)
+        if data and data.get('o') == self.ordering and isinstance(data.get('k'), list) \
+                and len(data['k']) == len(self.fields):
+            after = data.get('d') != 'p'
+            try:
+                rows = list(self.queryset.filter(self.keyset_filter(data['k'], after))
+                            .order_by(*self.order_by(reverse=not after))[:self.per_page + 1])
+            except (ValueError, TypeError): # 커서 값의 타입이 필드와 맞지 않음 (변조된 커서)
+                rows = []
+            more = len(rows) > self.per_page
+            rows = rows[:self.per_page]
+            if rows:
+                number = self.parse_number(data.get('p')) # 커서로 읽을 때는 COUNT 없음
+                if after:
+                    return KeysetPage(rows, number, self, has_next=more, has_previous=number > 1)
+                rows.reverse()
+                return KeysetPage(rows, number if more else 1, self, has_next=True, has_previous=more)
+            # 커서 뒤에 남은 행이 없으면 (그 사이 데이터가 바뀐 경우) 페이지 번호 방식으로
+            number = data.get('p')
+
+        number = self.validate_number(number)
+        offset = (number - 1) * self.per_page
+        rows = list(self.queryset.order_by(*self.order_by())[offset:offset + self.per_page + 1])
+        return KeysetPage(rows[:self.per_page], number, self,
+                          has_next=len(rows) > self.per_page, has_previous=number > 1)
+
+
+class KeysetPage:
+    """템플릿에서 Paginator 의 Page 처럼 쓸 수 있는 페이지 (next_cursor / previous_cursor 추가)"""
+    def __init__(self, object_list, number, paginator, has_next, has_previous):
+        self.object_list = object_list
+        self.number = number
+        self.paginator = paginator
+        self._has_next = has_next
+        self._has_previous = has_previous
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def has_next(self):
+        return self._has_next
+
+    def has_previous(self):
+        return self._has_previous
+
+    def next_page_number(self):
+        return self.number + 1
+
+    def previous_page_number(self):
+        return self.number - 1
+
+    def start_index(self):
+        return (self.number - 1) * self.paginator.per_page + 1 if self.object_list else 0
+
+    def cursor(self, obj, number, direction):
+        return encode_cursor({
+            'o': self.paginator.ordering,
+            'p': number,
+            'd': direction,
+            'k': self.paginator.key_of(obj),
+        })
+
+    def next_cursor(self):
+        return self.cursor(self.object_list[-1], self.number + 1, 'n') if self._has_next else ''
+
+    def previous_cursor(self):
+        return self.cursor(self.object_list[0], self.number - 1, 'p') if self._has_previous else ''
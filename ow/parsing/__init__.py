@@ -0,0 +1,28 @@
+# 재산 명세 파싱 (Django 없이 Data_Processing 스크립트에서도 import 가능)
+from ow.parsing.details import (
+    CHANGE_FRAGMENT_PATTERN,
+    ITEM_PATTERN,
+    ITEM_SEQUENCE_PATTERN,
+    PARSABLE_NAME_PATTERN,
+    PARSABLE_SPACING_PATTERN,
+    POLITICAL_FUND_NAME_PATTERN,
+    clean_value,
+    is_missing,
+    is_parsable_detail,
+    parse_detail,
+    parse_detail_text,
+)
+
+__all__ = [
+    'CHANGE_FRAGMENT_PATTERN',
+    'ITEM_PATTERN',
+    'ITEM_SEQUENCE_PATTERN',
+    'PARSABLE_NAME_PATTERN',
+    'PARSABLE_SPACING_PATTERN',
+    'POLITICAL_FUND_NAME_PATTERN',
+    'clean_value',
+    'is_missing',
+    'is_parsable_detail',
+    'parse_detail',
+    'parse_detail_text',
+]
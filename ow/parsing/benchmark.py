@@ -0,0 +1,147 @@
+# 명세 파서 마이크로 벤치마크: 예전 col_divide_* 함수 vs ow.parsing (초당 처리 문자열 수)
+# 사용법: python -m ow.parsing.benchmark [--count 50000] [--unique 5000] [--csv 파일 --column 열이름]
+import argparse
+import csv
+import random
+import re
+import time
+
+from ow.parsing.details import is_missing, is_parsable_detail, parse_detail, parse_detail_text
+
+BANKS = ['국민은행', '신한은행', '우리은행', '하나은행', '농협', '우체국', '새마을금고', '카카오뱅크', '미래에셋증권', '삼성생명']
+
+
+# --- 예전 col_divide_* 스크립트의 함수 (비교 기준, 호출마다 패턴 컴파일) ---
+def legacy_clean_value(value_str):
+    if is_missing(value_str) or str(value_str).strip() == "": return 0
+    try: return int(str(value_str).replace(',', '').strip())
+    except ValueError: return 0
+
+
+def legacy_parse(detail_string_original): # parse_financial_details_for_expansion_core
+    if is_missing(detail_string_original) or str(detail_string_original).strip() == "":
+        return [(None, 0, 0, 0, 0)]
+    detail_string = str(detail_string_original)
+    item_pattern = re.compile(r"(.+?)\s*([\d,]+)(?:\s*\(\s*([\d,]+)\s*(증\s*가|감\s*소)\s*\))?")
+    parsed_items = []
+    current_pos = 0
+    processed_something_in_loop = False
+    while current_pos < len(detail_string):
+        match = item_pattern.match(detail_string, current_pos)
+        if match:
+            processed_something_in_loop = True
+            item_name = match.group(1).strip(' ,')
+            current_value = legacy_clean_value(match.group(2))
+            increase_value = 0; decrease_value = 0
+            change_type = "".join(match.group(4).split()) if match.group(4) else None
+            previous_value = current_value
+            if match.group(3) and change_type:
+                change_amount = legacy_clean_value(match.group(3))
+                if change_type == '증가': increase_value = change_amount; previous_value = current_value - increase_value
+                elif change_type == '감소': decrease_value = change_amount; previous_value = current_value + decrease_value
+            parsed_items.append((item_name, previous_value, increase_value, decrease_value, current_value))
+            current_pos = match.end()
+            if current_pos < len(detail_string) and detail_string[current_pos] == ',': current_pos += 1
+            while current_pos < len(detail_string) and detail_string[current_pos].isspace(): current_pos += 1
+        else:
+            remaining_text = detail_string[current_pos:].strip(' ,')
+            if remaining_text:
+                if not (re.fullmatch(r"\(?\s*(?:증\s*가|감\s*소)\s*\)?", remaining_text, re.IGNORECASE) or
+                        re.fullmatch(r"(?:증\s*가|감\s*소)\s*\)?", remaining_text, re.IGNORECASE) or
+                        re.fullmatch(r"\(?\s*(?:증\s*가|감\s*소)", remaining_text, re.IGNORECASE)):
+                    parsed_items.append((remaining_text, 0, 0, 0, 0))
+                    processed_something_in_loop = True
+            break
+    if not processed_something_in_loop and str(detail_string_original).strip():
+        cleaned_original = str(detail_string_original).strip(' ,')
+        if cleaned_original:
+            parsed_items.append((cleaned_original, 0, 0, 0, 0))
+    if not parsed_items:
+        parsed_items.append((str(detail_string_original).strip(' ,'), 0, 0, 0, 0))
+    return parsed_items
+
+
+def legacy_is_parsable(detail_string): # is_parsable_detail_string
+    if is_missing(detail_string) or not str(detail_string).strip():
+        return False
+    s = str(detail_string)
+    if re.search(r'\d+ | \(', s):
+        if re.search(r"\S\s+[\d(]", s) or re.search(r"\S[\d(]", s):
+            if re.search(r'\d', s) or re.search(r'\(', s):
+                return True
+    return False
+
+
+# --- 측정 ---
+def sample_details(count, unique, seed=0):
+    """실제 명세처럼 보이는 문자열 count 개 (서로 다른 값은 unique 개, 신고연도마다 같은 명세가 반복되는 것을 흉내)"""
+    rng = random.Random(seed)
+    pool = []
+    for _ in range(unique):
+        kind = rng.random()
+        if kind < 0.3: # 이미 나뉜 이름만 있는 명세
+            pool.append(rng.choice(BANKS))
+        else:
+            items = []
+            for _ in range(rng.randint(1, 4)):
+                item = f"{rng.choice(BANKS)} {rng.randint(1, 10 ** 6):,}"
+                if rng.random() < 0.5:
+                    item += f" ({rng.randint(1, 10 ** 5):,} {rng.choice(['증가', '감소'])})"
+                items.append(item)
+            pool.append(', '.join(items))
+    return [rng.choice(pool) for _ in range(count)]
+
+
+def read_details(path, column): # CSV 파일의 명세 열
+    with open(path, encoding='utf-8-sig', newline='') as f:
+        return [row[column] for row in csv.DictReader(f)]
+
+
+def measure(func, details, repeat, setup=None): # 가장 빠른 회차 기준 초당 문자열 수
+    best = None
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        for detail in details:
+            func(detail)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return len(details) / best if best else float('inf')
+
+
+def run_benchmark(details, repeat=3):
+    """(이름, 초당 문자열 수) 목록. 측정 전에 예전 함수와 결과가 같은지 확인"""
+    for detail in details:
+        if tuple(legacy_parse(detail)) != parse_detail(detail) or legacy_is_parsable(detail) != is_parsable_detail(detail):
+            raise AssertionError(f'예전 함수와 결과가 다름: {detail!r}')
+    return [
+        ('legacy parse', measure(legacy_parse, details, repeat)),
+        ('parse_detail (uncached)', measure(parse_detail_text.__wrapped__, details, repeat)),
+        ('parse_detail (lru_cache)', measure(parse_detail, details, repeat, setup=parse_detail_text.cache_clear)),
+        ('legacy is_parsable', measure(legacy_is_parsable, details, repeat)),
+        ('is_parsable_detail', measure(is_parsable_detail, details, repeat)),
+    ]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='명세 파서 마이크로 벤치마크 (strings/sec)')
+    parser.add_argument('--count', type=int, default=50000, help='측정할 문자열 수 (기본값: 50000)')
+    parser.add_argument('--unique', type=int, default=5000, help='서로 다른 문자열 수 (기본값: 5000)')
+    parser.add_argument('--repeat', type=int, default=3, help='반복 횟수, 가장 빠른 회차 사용 (기본값: 3)')
+    parser.add_argument('--csv', help='합성 데이터 대신 이 CSV 파일의 명세 열 사용')
+    parser.add_argument('--column', default='소재지 면적 등 권리의 명세', help='--csv 의 명세 열 이름')
+    args = parser.parse_args(argv)
+
+    details = read_details(args.csv, args.column) if args.csv else sample_details(args.count, args.unique)
+    print(f"명세 {len(details)}개 (서로 다른 값 {len(set(details))}개), {args.repeat}회 중 최고 기록")
+    results = run_benchmark(details, args.repeat)
+    baselines = {'parse': results[0][1], 'is_parsable': results[3][1]}
+    for name, rate in results:
+        baseline = baselines['is_parsable' if 'parsable' in name else 'parse']
+        print(f"{name:<28} {rate:>12,.0f} strings/sec  (x{rate / baseline:.1f})")
+    return results
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+# 재산 명세 문자열 파서: '국민은행 1,000 (500 증가), 신한은행 2,000' -> 항목별 (이름, 종전가액, 증가액, 감소액, 현재가액)
+# 패턴은 import 할 때 한 번만 컴파일, 같은 명세(신고연도마다 반복됨)는 lru_cache 로 다시 파싱하지 않음
+import re
+from functools import lru_cache
+
+PARSE_CACHE_SIZE = 2 ** 16 # 캐시할 서로 다른 명세 문자열 수
+
+# 항목 하나: 이름 금액 (변동액 증가/감소)
+ITEM_PATTERN = re.compile(r"(.+?)\s*([\d,]+)(?:\s*\(\s*([\d,]+)\s*(증\s*가|감\s*소)\s*\))?")
+# 항목 뒤의 쉼표 1개와 공백까지 한 매치로 -> 다음 항목은 match.end() 에서 시작
+ITEM_SEQUENCE_PATTERN = re.compile(ITEM_PATTERN.pattern + r",?\s*")
+# 이름 없이 남은 '(증가)', '감소)' 같은 조각은 항목으로 만들지 않음
+CHANGE_FRAGMENT_PATTERN = re.compile(r"\(?\s*(?:증\s*가|감\s*소)\s*\)?|(?:증\s*가|감\s*소)\s*\)?|\(?\s*(?:증\s*가|감\s*소)")
+# 정치자금 예금: 첫 숫자/괄호 앞까지가 이름
+POLITICAL_FUND_NAME_PATTERN = re.compile(r"(.+?)(?=\s*[\d(])|(.*)")
+
+# 빠른 사전 검사 (정규식 한 번으로 대부분의 '이름만 있는' 명세를 걸러냄)
+ITEM_HINT_PATTERN = re.compile(r"[\d,]") # 항목 패턴의 금액 부분은 숫자나 쉼표가 있어야 맞음
+PARSABLE_HINT_PATTERN = re.compile(r"[\d(]")
+PARSABLE_SPACING_PATTERN = re.compile(r"\d+ | \(")
+PARSABLE_NAME_PATTERN = re.compile(r"\S\s*[\d(]") # 이름 뒤에 (공백) 숫자 또는 괄호
+
+EMPTY_ITEMS = ((None, 0, 0, 0, 0),)
+
+
+def is_missing(value): # None / NaN / pd.NA (pandas 없이 pd.isna 와 같은 판단)
+    if value is None:
+        return True
+    try:
+        return bool(value != value)
+    except TypeError: # pd.NA 는 bool() 이 안 됨
+        return True
+
+
+def clean_value(value): # '1,000' -> 1000, 빈 값이나 정수로 읽을 수 없는 값은 0
+    if is_missing(value):
+        return 0
+    text = str(value).replace(',', '').strip()
+    try:
+        return int(text)
+    except ValueError:
+        return 0
+
+
+def parse_detail(detail):
+    """명세 1개 -> ((이름, 종전가액, 증가액, 감소액, 현재가액), ...), 빈 명세는 이름 None 항목 1개"""
+    if is_missing(detail):
+        return EMPTY_ITEMS
+    return parse_detail_text(str(detail))
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def parse_detail_text(text): # 결과는 tuple 이라 캐시된 값을 호출한 쪽에서 바꿀 수 없음
+    if not text.strip():
+        return EMPTY_ITEMS
+    if not ITEM_HINT_PATTERN.search(text): # 금액이 없으면 전체가 이름
+        return ((text.strip(' ,'), 0, 0, 0, 0),)
+
+    items = []
+    position = 0
+    while position < len(text):
+        match = ITEM_SEQUENCE_PATTERN.match(text, position)
+        if not match:
+            rest = text[position:].strip(' ,')
+            if rest and not CHANGE_FRAGMENT_PATTERN.fullmatch(rest):
+                items.append((rest, 0, 0, 0, 0))
+            break
+
+        name, current, change, change_type = match.groups()
+        current = clean_value(current)
+        increase = decrease = 0
+        change_type = ''.join(change_type.split()) if change_type else None
+        if change_type == '증가':
+            increase = clean_value(change)
+        elif change_type == '감소':
+            decrease = clean_value(change)
+        items.append((name.strip(' ,'), current - increase + decrease, increase, decrease, current))
+        position = match.end()
+
+    if not items: # 매칭된 항목이 없으면 전체를 이름만 있는 항목 1개로
+        items.append((text.strip(' ,'), 0, 0, 0, 0))
+    return tuple(items)
+
+
+def is_parsable_detail(detail): # 이름 뒤에 금액/괄호가 붙어 있어서 나눌 수 있는 명세인지 (이미 나뉜 '국민은행' 은 False)
+    if is_missing(detail):
+        return False
+    text = str(detail)
+    if not PARSABLE_HINT_PATTERN.search(text): # 숫자도 괄호도 없음
+        return False
+    return bool(text.strip() and PARSABLE_SPACING_PATTERN.search(text) and PARSABLE_NAME_PATTERN.search(text))
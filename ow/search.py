@@ -0,0 +1,109 @@
+# 의원 검색 (n-gram 색인 + 초성 검색 + 자동완성)
+from django.db import transaction
+from django.db.models import Case, Count, IntegerField, Q, Value, When
+
+from ow.models import CHOSUNG, Legislator, LegislatorSearchToken
+
+SEARCH_FIELDS = ['name', 'chi_name', 'party', 'electoral_district'] # 검색 대상 컬럼
+AUTOCOMPLETE_LIMIT = 10 # 자동완성 결과 개수
+
+
+def normalize(text): # 공백 제거 + 소문자 (색인/검색어 공통)
+    return ''.join((text or '').split()).lower()
+
+
+def ngrams(text): # 1글자, 2글자 조각 (한글 이름은 2~3글자라 2-gram 까지만 색인)
+    text = normalize(text)
+    grams = set(text)
+    grams.update(text[i:i + 2] for i in range(len(text) - 1))
+    return grams
+
+
+def query_grams(query): # 검색어가 반드시 포함해야 하는 조각 (1글자면 그 글자, 아니면 2-gram 전부)
+    text = normalize(query)
+    if len(text) <= 1:
+        return {text} if text else set()
+    return {text[i:i + 2] for i in range(len(text) - 1)}
+
+
+def is_chosung(query): # 'ㅎㄱㄷ' 처럼 초성만으로 된 검색어인지
+    text = normalize(query)
+    return bool(text) and all(char in CHOSUNG for char in text)
+
+
+def prefix_q(field, prefix): # LIKE 'x%' 대신 범위 조건 (DB 와 상관없이 일반 인덱스 사용)
+    return Q(**{f"{field}__gte": prefix, f"{field}__lt": prefix + '\uffff'})
+
+
+def legislator_tokens(legislator):
+    grams = set()
+    for field in SEARCH_FIELDS:
+        grams |= ngrams(getattr(legislator, field))
+    return [LegislatorSearchToken(legislator_id=legislator.member_id, token=gram) for gram in grams]
+
+
+def rebuild_search_index(member_ids=None, batch_size=2000): # 색인 다시 만들기 (import 후 호출)
+    legislators = Legislator.objects.only('member_id', *SEARCH_FIELDS)
+    tokens = LegislatorSearchToken.objects.all()
+    if member_ids is not None:
+        legislators = legislators.filter(member_id__in=member_ids)
+        tokens = tokens.filter(legislator_id__in=member_ids)
+
+    created = 0
+    with transaction.atomic():
+        tokens.delete()
+        batch = []
+        for legislator in legislators.iterator(chunk_size=batch_size):
+            batch.extend(legislator_tokens(legislator))
+            if len(batch) >= batch_size:
+                LegislatorSearchToken.objects.bulk_create(batch, batch_size=batch_size)
+                created += len(batch)
+                batch = []
+        if batch:
+            LegislatorSearchToken.objects.bulk_create(batch, batch_size=batch_size)
+            created += len(batch)
+    return created
+
+
+def search_legislators(query, queryset=None):
+    """
+    검색어로 의원 queryset 을 거름.
+    초성만 입력하면 이름 초성 앞부분 일치, 그 외에는 n-gram 색인으로 후보를 찾고
+    검색 대상 컬럼 중 하나에 검색어가 들어있는 의원만 남김.
+    """
+    if queryset is None:
+        queryset = Legislator.objects.all()
+    query = (query or '').strip()
+    if not query:
+        return queryset
+
+    if is_chosung(query):
+        return queryset.filter(prefix_q('name_chosung', normalize(query)))
+
+    grams = query_grams(query)
+    candidates = (
+        LegislatorSearchToken.objects.filter(token__in=grams)
+        .values('legislator_id')
+        .annotate(matched=Count('token'))
+        .filter(matched=len(grams))
+        .values('legislator_id')
+    )
+    contains = Q()
+    for field in SEARCH_FIELDS:
+        contains |= Q(**{f"{field}__icontains": query})
+    return queryset.filter(member_id__in=candidates).filter(contains)
+
+
+def autocomplete(query, limit=AUTOCOMPLETE_LIMIT): # 이름 앞부분 일치 -> 현재 대수 -> 이름 순
+    query = (query or '').strip()
+    if not query:
+        return []
+    prefix = normalize(query) if is_chosung(query) else query
+    field = 'name_chosung' if is_chosung(query) else 'name'
+    results = (
+        search_legislators(query)
+        .annotate(prefix_rank=Case(When(prefix_q(field, prefix), then=Value(0)), default=Value(1), output_field=IntegerField()))
+        .order_by('prefix_rank', '-latest_term', 'name', 'member_id')
+        .values('member_id', 'name', 'party', 'electoral_district')[:limit]
+    )
+    return list(results)
@@ -0,0 +1,38 @@
+# 읽기 전용 API 직렬화 (ow/api.py)
+from rest_framework import serializers
+
+from ow.models import Legislator, Asset
+
+
+class FieldSelectionSerializer(serializers.ModelSerializer):
+    """?fields=a,b 로 응답 필드를 고르는 serializer (모르는 필드는 무시)"""
+    def __init__(self, *args, fields=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if fields:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+
+    @classmethod
+    def selected_fields(cls, params): # 쿼리 파라미터에서 고른 필드 (없으면 전체), 순서는 Meta.fields 기준
+        requested = {f.strip() for f in params.get('fields', '').split(',') if f.strip()}
+        fields = [f for f in cls.Meta.fields if f in requested]
+        return fields or list(cls.Meta.fields)
+
+
+class LegislatorSerializer(FieldSelectionSerializer):
+    class Meta:
+        model = Legislator
+        fields = [
+            'member_id', 'name', 'chi_name', 'birth', 'party', 'electoral_district', 'region', 'committee',
+            'latest_age', 'latest_term', 'gender', 'reelected', 'total_assets', 'updated_at',
+        ]
+
+
+class AssetSerializer(FieldSelectionSerializer):
+    class Meta:
+        model = Asset
+        fields = [
+            'id', 'openwatch_asset_id', 'member_id', 'name', 'report_year', 'report_month', 'asset_type',
+            'relation', 'kind', 'detail', 'origin_valuation', 'increased_amount', 'decreased_amount',
+            'current_valuation', 'reason_for_change',
+        ]
@@ -2,161 +2,713 @@
 import requests
 import time
 import math
+import os
+import csv
+import json
+import tempfile
+import random
+import datetime
+import email.utils
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from .models import Legislator, Asset
-from django.db import IntegrityError
+from .db import copy_upsert, is_postgres
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F, Max, OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce
 
 OPENWATCH_BASE_URL = "https://openwatch.kr/api/national-assembly"
 MEMBERS_ENDPOINT = f"{OPENWATCH_BASE_URL}/members" # 의원 정보 엔드포인트
 ASSETS_ENDPOINT = f"{OPENWATCH_BASE_URL}/assets" # 자산 정보 엔드포인트
 
-def fetch_api_data(url, params=None): # API 데이터 가져오는 함수
+DEFAULT_CONCURRENCY = 1 # 동시에 요청할 페이지 수 (1이면 순차 요청)
+DEFAULT_RATE_LIMIT = 2.0 # 초당 최대 요청 수 (기존 0.5초 대기와 같은 속도)
+DEFAULT_BATCH_SIZE = 500 # DB에 한 번에 저장할 행 수
+TOTAL_EXCLUDED_ASSET_TYPES = ['채무', '비영리법인에 출연한 재산'] # 총 재산 합계에서 빼는 자산 구분
+DEFAULT_STATUS_FILE = os.path.join(settings.BASE_DIR, '.fetch_status.json') # 페이지 진행 상황 저장 파일
+CHANGED_MEMBERS_KEY = 'totals_changed_members' # 상태 파일: 자산이 삭제/이동되어 총 재산을 다시 계산할 의원 ID
+
+# --output-file 로 저장할 때의 CSV 헤더 (API 필드 이름 기준)
+OUTPUT_FILE_COLUMNS = [
+    'api_asset_id', 'api_member_id', 'api_date', 'api_type', 'api_kind', 'api_relation', 'api_detail',
+    'api_current_valuation', 'api_origin_valuation', 'api_increased_amount', 'api_decreased_amount',
+    'api_reason_change',
+]
+
+MAX_RETRIES = 5 # 429/5xx, 연결 오류 시 재시도 횟수
+BACKOFF_BASE = 1.0 # 첫 재시도 대기 시간(초), 재시도마다 2배
+BACKOFF_MAX = 60.0 # 대기 시간 상한(초), Retry-After 도 이 값까지만 따름
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+_session = None
+_session_lock = threading.Lock()
+
+def get_session(): # keep-alive 연결을 재사용하는 공용 세션 (처음 호출할 때 생성)
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=32)
+            _session.mount('http://', adapter)
+            _session.mount('https://', adapter)
+        return _session
+
+class FetchStats: # API 요청 횟수, 지연 시간, 받은 바이트 수 집계
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        self.requests = 0
+        self.retries = 0
+        self.failures = 0
+        self.bytes = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+
+    def record(self, latency, size=0):
+        with self.lock:
+            self.requests += 1
+            self.bytes += size
+            self.total_latency += latency
+            self.max_latency = max(self.max_latency, latency)
+
+    def count(self, name): # 'retries' 또는 'failures' 1 증가
+        with self.lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def summary(self):
+        avg = self.total_latency / self.requests if self.requests else 0
+        return (f"요청 {self.requests}회, 재시도 {self.retries}회, 실패 {self.failures}회, "
+                f"{self.bytes / 1024 / 1024:.1f}MB, 평균 {avg:.2f}s, 최대 {self.max_latency:.2f}s")
+
+fetch_stats = FetchStats()
+
+def parse_retry_after(value): # Retry-After 헤더(초 또는 HTTP 날짜) -> 대기 시간(초), 해석 불가면 None
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (retry_at - datetime.datetime.now(datetime.timezone.utc)).total_seconds())
+
+def backoff_delay(attempt): # 지수 백오프 + jitter (동시 요청들이 같은 시각에 몰리지 않도록)
+    delay = min(BACKOFF_MAX, BACKOFF_BASE * (2 ** attempt))
+    return delay * random.uniform(0.5, 1.0)
+
+def fetch_api_data(url, params=None, max_retries=None): # API 데이터 가져오는 함수
     print(f"API url: {url}, params: {params or {}}")
+    if max_retries is None:
+        max_retries = MAX_RETRIES
+    session = get_session()
+    for attempt in range(max_retries + 1):
+        started = time.monotonic()
+        try:
+            response = session.get(url, params=params, timeout=60) # 타임아웃 늘림
+        except requests.exceptions.RequestException as e:
+            fetch_stats.record(time.monotonic() - started)
+            print(f"Error: 요청 실패 {url} ({type(e).__name__})")
+            wait = backoff_delay(attempt)
+        else:
+            latency = time.monotonic() - started
+            fetch_stats.record(latency, len(response.content))
+            print(f"API Response Status Code: {response.status_code} ({latency:.2f}s, {len(response.content)} bytes)")
+            if response.status_code not in RETRY_STATUS_CODES:
+                try:
+                    response.raise_for_status() # 재시도 대상이 아닌 HTTP 오류는 바로 실패 처리
+                    return response.json()
+                except (requests.exceptions.HTTPError, ValueError) as e:
+                    print(f"Error: {url} {e}")
+                    fetch_stats.count('failures')
+                    return None
+            retry_after = parse_retry_after(response.headers.get('Retry-After'))
+            wait = min(BACKOFF_MAX, retry_after) if retry_after is not None else backoff_delay(attempt)
+
+        if attempt < max_retries:
+            fetch_stats.count('retries')
+            print(f"{wait:.1f}초 후 재시도 ({attempt + 1}/{max_retries})")
+            time.sleep(wait)
+
+    print(f"Error: 재시도 횟수 초과 {url}")
+    fetch_stats.count('failures')
+    return None
+
+class RateLimiter: # 토큰 버킷 방식의 요청 속도 제한 (여러 스레드가 공유)
+    def __init__(self, rate, capacity=None):
+        self.rate = rate # 초당 채워지는 토큰 수, 0 이하이면 제한 없음
+        self.capacity = capacity or max(1, int(rate or 1)) # 한 번에 몰아서 쓸 수 있는 최대 토큰 수
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self): # 토큰이 생길 때까지 기다렸다가 하나 사용
+        if not self.rate or self.rate <= 0:
+            return
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+                self.updated_at = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+def fetch_pages(url, limit_param='limit', items_per_page=100, concurrency=DEFAULT_CONCURRENCY,
+                rate_limit=DEFAULT_RATE_LIMIT, max_pages=0, start_page=1, result=None):
+    """페이지 단위로 API 데이터를 가져와 (페이지 번호, rows) 를 페이지 순서대로 돌려주는 제너레이터
+
+    start_page 부터 요청하고, max_pages > 0 이면 이번 실행에서 최대 max_pages 페이지까지만 가져옴.
+    result 에 dict 를 주면 마지막 페이지까지 받았을 때 result['complete'] = True (요청 실패, max_pages 로 멈추면 False).
+    concurrency > 1 이면 첫 페이지의 totalCount 로 전체 페이지 수를 구한 뒤
+    나머지 페이지를 스레드 풀로 동시에 요청함. 응답이 도착한 순서와 상관없이 항상 페이지 순서로 반환.
+    """
+    limiter = RateLimiter(rate_limit)
+    if result is None:
+        result = {}
+    result['complete'] = False
+
+    def fetch_page(page_num):
+        limiter.acquire()
+        return fetch_api_data(url, params={'page': page_num, limit_param: items_per_page})
+
+    # 첫 페이지는 항상 먼저 받아서 전체 개수 확인
+    first_page = fetch_page(start_page)
+    if not first_page:
+        print("요청 실패 > 중단")
+        return
+    total_count = first_page.get('totalCount') or 0
+    rows = first_page.get('rows', [])
+    if not rows: # 마지막 페이지 뒤 (이미 끝까지 받음)
+        result['complete'] = True
+        return
+    yield start_page, rows
+
+    received = (start_page - 1) * items_per_page + len(rows)
+    if total_count > 0 and received >= total_count:
+        result['complete'] = True
+        return
+
+    total_pages = math.ceil(total_count / items_per_page) if total_count > 0 else 0
+    last_page = total_pages
+    if max_pages > 0:
+        max_last_page = start_page + max_pages - 1
+        last_page = min(last_page, max_last_page) if last_page else max_last_page
+        if last_page <= start_page:
+            return
+
+    if concurrency <= 1 or not last_page:
+        # 순차 요청: 빈 페이지가 나오거나 totalCount 만큼 받으면 종료
+        page_num = start_page + 1
+        while not last_page or page_num <= last_page:
+            page_data = fetch_page(page_num)
+            if not page_data:
+                print("요청 실패 > 중단")
+                return
+            rows = page_data.get('rows', [])
+            if not rows:
+                result['complete'] = True
+                return
+            yield page_num, rows
+            received += len(rows)
+            if total_count > 0 and received >= total_count:
+                result['complete'] = True
+                return
+            page_num += 1
+        result['complete'] = last_page == total_pages
+        return
+
+    # 동시 요청: 최대 concurrency * 2 개까지만 미리 요청해두고 페이지 순서대로 꺼냄
+    print(f"동시 요청 시작 / 마지막 페이지: {last_page}, 동시 요청 수: {concurrency}")
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        pending = {}
+        next_to_submit = start_page + 1
+        for page_num in range(start_page + 1, last_page + 1):
+            while next_to_submit <= last_page and len(pending) < concurrency * 2:
+                pending[next_to_submit] = executor.submit(fetch_page, next_to_submit)
+                next_to_submit += 1
+            page_data = pending.pop(page_num).result()
+            rows = page_data.get('rows') if page_data else None
+            # 크롤링 중에 totalCount 가 줄었으면 그 기준의 마지막 페이지에서 끝 (짧은 마지막 페이지, 그 뒤의 빈 페이지)
+            current_total = (page_data or {}).get('totalCount')
+            current_pages = math.ceil(current_total / items_per_page) if current_total is not None else total_pages
+            if rows:
+                yield page_num, rows
+                if page_num < current_pages:
+                    continue
+                result['complete'] = True # 마지막 페이지 (totalCount 가 줄었으면 원래보다 앞의 짧은 페이지)
+            elif page_data and page_num > current_pages:
+                print(f"totalCount 가 {current_total} 로 줄어서 {page_num - 1} 페이지까지 받음")
+                result['complete'] = True
+            else:
+                # 중간 페이지 실패 시 그 뒤 페이지는 버림 (결과가 항상 앞에서부터 연속되도록)
+                print(f"요청 실패 또는 빈 페이지 {page_num} > 중단")
+            for future in pending.values():
+                future.cancel()
+            return
+    result['complete'] = last_page == total_pages
+
+def chunked(iterable, size): # 이터러블을 size 개씩 리스트로 묶어서 돌려줌 (마지막 묶음은 더 작을 수 있음)
+    batch = []
+    for item in iterable:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+def chunk_pages(pages, size): # (페이지 번호, rows) 스트림을 size 행 이상씩 페이지 단위로 묶음 -> (마지막 페이지 번호, items)
+    batch = []
+    for page_num, items_on_page in pages:
+        print(f"{page_num} 페이지에서 {len(items_on_page)}개 가져옴")
+        batch.extend(items_on_page)
+        if len(batch) >= size:
+            yield page_num, batch
+            batch = []
+    if batch:
+        yield page_num, batch
+
+def load_status(status_file=DEFAULT_STATUS_FILE): # 상태 파일 읽기 (없거나 깨졌으면 빈 dict)
+    try:
+        with open(status_file, encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (ValueError, OSError) as e:
+        print(f"Error: 상태 파일 읽기 실패 {status_file}: {e}")
+        return {}
+
+def save_status(status, status_file=DEFAULT_STATUS_FILE): # 상태 파일 저장 (임시 파일에 쓴 뒤 교체해서 중간에 죽어도 깨지지 않음)
+    directory = os.path.dirname(os.path.abspath(status_file))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.fetch_status.', suffix='.tmp')
     try:
-        response = requests.get(url, params=params, timeout=60) # 타임아웃 늘림
-        response.raise_for_status() # HTTP 오류 발생 시 예외 발생
-        print(f"API Response Status Code: {response.status_code}")
-        return response.json()
-    except requests.exceptions.Timeout:
-        print(f"Error: 타임아웃 {url}")
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(status, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, status_file)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+def record_changed_members(member_ids, status_file=DEFAULT_STATUS_FILE):
+    """자산이 삭제되거나 다른 의원으로 옮겨진 의원 ID 를 상태 파일에 기록
+
+    남은 자산의 updated_at 으로는 찾을 수 없으므로 update_latest_assets --only-changed 가 이 목록도 다시 계산함
+    """
+    if not member_ids or not status_file:
+        return
+    status = load_status(status_file)
+    status[CHANGED_MEMBERS_KEY] = sorted(set(status.get(CHANGED_MEMBERS_KEY, [])) | set(member_ids))
+    save_status(status, status_file)
+
+def delete_status(status_file=DEFAULT_STATUS_FILE): # 상태 파일 삭제 (--reset-status)
+    if os.path.exists(status_file):
+        os.remove(status_file)
+        print(f"상태 파일 삭제: {status_file}")
+
+def checkpoint(status_file, key): # batch 저장이 끝날 때마다 마지막 페이지 번호를 상태 파일에 기록하는 콜백
+    if not status_file:
         return None
-    
-def save_legislators(): # 의원 정보 저장
-    print("\n의원 정보 저장 시작")
-    all_legislator_items = [] # 페이지 체크
-    page_num = 1
-    items_per_page = 100
-    PARAM_NAME_PAGE = 'page'
-    PARAM_NAME_LIMIT = 'pageSize'
-    total_count = 0
-
-    while True:
-        params = {
-            PARAM_NAME_PAGE: page_num,
-            PARAM_NAME_LIMIT: items_per_page
-        }
-        print(f"/member page {page_num} (pageSize {items_per_page}) from: {MEMBERS_ENDPOINT}")
-        page_data = fetch_api_data(MEMBERS_ENDPOINT, params=params)
-
-        if not page_data: # API 요청 실패 시 중단
-            print(f"요청 실패 > 중단")
-            break
-
-        if page_num == 1: # 첫 페이지 응답에서 전체 개수 확인
-            if 'totalCount' in page_data:
-                total_count = page_data['totalCount']
-                print(f"저장된 의원 정보 데이터의 양: {total_count}")
-                if total_count == 0:
-                    print("데이터 없음")
-                    break
-        # 현재 페이지의 데이터(rows) 가져오기
-        items_on_page = page_data.get('rows', [])
-        if not items_on_page:
-            print(f"종료 / 페이지에 데이터 없음 {page_num}")
-            break
-
-        # 가져온 데이터를 전체 리스트에 추가
-        all_legislator_items.extend(items_on_page)
-        print(f"{page_num} 페이지에서 legislator 정보를 {len(items_on_page)}만큼 가져옴. 총 받은 양: {len(all_legislator_items)}")
-
-        # 만약 total_count를 얻었고, 누적된 아이템 수가 total_count 이상이면 종료
-        if total_count > 0 and len(all_legislator_items) >= total_count:
-            print("데이터 다 받았으므로 종료")
-            break
-
-        page_num += 1
-        time.sleep(0.5) # 서버 부하 방지 0.5초 대기
-
-    print(f"\n의원 정보 가져오기 끝")
-
-    saved_count = 0
-    updated_count = 0
-    skipped_count = 0
-    total_rows_to_process = len(all_legislator_items)
 
-    if total_rows_to_process > 0:
-        print(f"DB에 legislator 정보 저장 시작. 총량: {total_rows_to_process}")
+    def on_commit(page_num):
+        status = load_status(status_file)
+        status[key] = page_num
+        save_status(status, status_file)
+    return on_commit
+
+def finish_crawl(status_file, key, crawl): # 마지막 페이지까지 받았으면 체크포인트 삭제 (다음 실행은 1 페이지부터)
+    if not status_file or not crawl.get('complete'):
+        return
+    status = load_status(status_file)
+    if status.pop(key, None) is not None:
+        save_status(status, status_file)
+        print(f"마지막 페이지까지 받음 > 상태 파일의 {key} 삭제")
+
+# API 에서 받는 필드 (API 가 값을 주지 않으면 기존 값 유지) + 그 값으로 계산하는 필드
+LEGISLATOR_SOURCE_FIELDS = ['name', 'party', 'gender', 'reelected', 'electoral_district', 'latest_age']
+LEGISLATOR_API_FIELDS = LEGISLATOR_SOURCE_FIELDS + ['latest_term', 'region', 'name_chosung']
+ASSET_UPDATE_FIELDS = [
+    'legislator', 'member_id', 'name', 'report_year', 'report_month', 'asset_type', 'kind', 'relation', 'detail',
+    'current_valuation', 'origin_valuation', 'increased_amount', 'decreased_amount', 'reason_for_change', 'row_hash',
+    'updated_at',
+]
+
+def bulk_upsert(model, objs, unique_field, update_fields, batch_size=DEFAULT_BATCH_SIZE, on_batch=None):
+    """bulk_create(update_conflicts=True) 로 batch 단위 upsert
+
+    batch 마다 한 트랜잭션에서 SELECT 1번(기존 키 확인) + INSERT ... ON CONFLICT DO UPDATE 로 처리.
+    PostgreSQL 은 COPY FROM STDIN 1번 + INSERT ... ON CONFLICT DO UPDATE 1번 (ow.db.copy_upsert).
+    같은 batch 안에서 키가 겹치면 마지막 행만 저장하고 나머지는 skipped 로 셈.
+    on_batch(created, updated, skipped) 를 주면 batch 마다 출력 대신 호출함.
+    반환값: (created, updated, skipped) 합계
+    """
+    created_count = updated_count = skipped_count = 0
+    for batch in chunked(objs, batch_size):
+        by_key = {}
+        for obj in batch:
+            by_key[getattr(obj, unique_field)] = obj
+        skipped = len(batch) - len(by_key)
+
+        with transaction.atomic():
+            if is_postgres(): # COPY 로 임시 테이블에 넣고 INSERT ... ON CONFLICT DO UPDATE (기존 키 조회 없음)
+                created = copy_upsert(model, by_key.values(), unique_field, update_fields)
+            else:
+                existing = set(
+                    model.objects.filter(**{f"{unique_field}__in": list(by_key)}).values_list(unique_field, flat=True)
+                )
+                model.objects.bulk_create(
+                    list(by_key.values()),
+                    update_conflicts=True,
+                    unique_fields=[unique_field],
+                    update_fields=update_fields,
+                )
+                created = len(by_key) - len(existing)
+        updated = len(by_key) - created
+        report_batch(model, on_batch, created, updated, skipped)
+        created_count += created
+        updated_count += updated
+        skipped_count += skipped
+    return created_count, updated_count, skipped_count
+
+def report_batch(model, on_batch, created, updated, skipped): # batch 저장 결과 출력 (on_batch 가 있으면 대신 호출)
+    if on_batch:
+        on_batch(created, updated, skipped)
     else:
-        print("DB에 저장할 legislator 정보가 없음")
-        return 0, 0, 0
-
-    # 가져온 모든 의원 정보(all_legislator_items)를 순회하며 DB에 저장
-    for i, member_info in enumerate(all_legislator_items):
-        # 진행 상황 로그
-        if (i + 1) % 100 == 0:
-             print(f"DB에 legislator 정보 저장 중 {i+1} / {total_rows_to_process}...")
-
-        member_id = member_info.get('id')
-        if not member_id:
-            skipped_count += 1
-            continue
+        print(f"{model.__name__} batch 저장 - Created: {created}, Updated: {updated}, Skipped: {skipped}")
+
+def bulk_insert_new(model, objs, unique_field, batch_size=DEFAULT_BATCH_SIZE, on_batch=None):
+    """고유 키(unique_field) 가 이미 있는 행은 건너뛰고 없는 행만 batch 단위로 bulk_create
+
+    batch 마다 한 트랜잭션에서 고유 인덱스 조회(SELECT ... IN) 1번 + INSERT 1번 (PostgreSQL 은 COPY 1번 + INSERT 1번).
+    같은 batch 안에서 키가 겹치면 처음 행만 저장. 반환값: (created, updated, skipped) 합계 (updated 는 항상 0)
+    """
+    created_count = skipped_count = 0
+    for batch in chunked(objs, batch_size):
+        by_key = {}
+        for obj in batch:
+            by_key.setdefault(getattr(obj, unique_field), obj)
+        with transaction.atomic():
+            if is_postgres(): # COPY 로 임시 테이블에 넣고 INSERT ... ON CONFLICT DO NOTHING
+                created = copy_upsert(model, by_key.values(), unique_field)
+            else:
+                existing = set(
+                    model.objects.filter(**{f"{unique_field}__in": list(by_key)}).values_list(unique_field, flat=True)
+                )
+                new_objs = [obj for key, obj in by_key.items() if key not in existing]
+                model.objects.bulk_create(new_objs, ignore_conflicts=True) # 동시에 들어온 같은 행은 무시
+                created = len(new_objs)
+        skipped = len(batch) - created
+        report_batch(model, on_batch, created, 0, skipped)
+        created_count += created
+        skipped_count += skipped
+    return created_count, 0, skipped_count
+
+def parse_legislator_item(member_info): # API 의원 항목 -> 저장할 Legislator 객체 (유효하지 않으면 None)
+    member_id = member_info.get('id')
+    if not member_id:
+        return None
+
+    # API 에 없는 값은 None 으로 두고, 저장할 때 기존 값으로 채움 (keep_existing_values)
+    return Legislator(
+        member_id=member_id,
+        name=member_info.get('name'),
+        party=member_info.get('partyName'),
+        gender=member_info.get('gender'),
+        reelected=member_info.get('reelected'),
+        electoral_district=member_info.get('electoralDistrict'),
+        latest_age=member_info.get('latestAge'),
+        # 필요한 다른 필드들도 여기에 추가 (LEGISLATOR_SOURCE_FIELDS 도 같이 수정)
+    )
+
+def keep_existing_values(legislators):
+    """
+    API 가 주지 않은(None) 필드는 DB 의 기존 값으로 채움 (import_data --members 로 넣은 값을 지우지 않도록)
+    새 의원이면 필드 기본값 (이름은 '')
+    기존 행 조회 1번, 계산 필드(latest_term 등)는 합친 값으로 다시 계산
+    """
+    existing = Legislator.objects.in_bulk([legislator.member_id for legislator in legislators])
+    for legislator in legislators:
+        current = existing.get(legislator.member_id)
+        for field in LEGISLATOR_SOURCE_FIELDS:
+            if getattr(legislator, field) is None:
+                value = getattr(current, field) if current else Legislator._meta.get_field(field).get_default()
+                setattr(legislator, field, value)
+        legislator.fill_derived_fields() # bulk 저장은 save() 를 거치지 않음
+    return legislators
+
+def parse_asset_item(item, legislators_dict): # API 자산 항목 -> 저장할 Asset 객체 (유효하지 않으면 None)
+    openwatch_asset_id = item.get('id')
+    national_assembly_member_id = item.get('nationalAssemblyMemberId')
+    date_str = item.get('date')
+
+    if not openwatch_asset_id or not national_assembly_member_id or not date_str:
+        return None
+    legislator = legislators_dict.get(national_assembly_member_id) # 딕셔너리에서 조회
+    if legislator is None:
+        # 미리 로드한 딕셔너리에 해당 의원이 없으면 건너뛰기
+        return None
 
-        defaults = {
-            'name': member_info.get('name'),
-            'party': member_info.get('partyName'),
-            'gender': member_info.get('gender'),
-            'reelected': member_info.get('reelected'),
-            'electoral_district': member_info.get('electoralDistrict'),
-            'latest_age': member_info.get('latestAge'),
-            # 필요한 다른 필드들도 여기에 추가
-        }
-        defaults = {k: v for k, v in defaults.items() if v is not None}
+    report_year, report_month = Asset.parse_date_string(date_str)
+    if report_year is None or report_month is None:
+        return None
 
+    asset = Asset(
+        openwatch_asset_id=openwatch_asset_id,
+        legislator=legislator,
+        member_id=national_assembly_member_id,
+        name=legislator.name,
+        report_year=report_year,
+        report_month=report_month,
+        asset_type=item.get('type') or '',
+        kind=item.get('kind'),
+        relation=item.get('relation') or '',
+        detail=item.get('detail') or '',
+        current_valuation=item.get('currentValutaion') or item.get('currentValuation'),
+        origin_valuation=item.get('originValuation'),
+        increased_amount=item.get('increasedAmount'),
+        decreased_amount=item.get('decreasedAmount'),
+        reason_for_change=item.get('reason'),
+    )
+    asset.row_hash = asset.compute_row_hash() # bulk 저장은 save() 를 거치지 않음
+    return asset
+
+def write_legislator_batch(legislators): # 의원 정보 묶음을 bulk upsert 로 저장 (실패하면 예외, run_pipeline 에서 처리)
+    return bulk_upsert(Legislator, keep_existing_values(legislators), 'member_id',
+                       LEGISLATOR_API_FIELDS + ['updated_at'], batch_size=max(1, len(legislators)))
+
+def drop_duplicate_assets(assets):
+    """내용(row_hash)이 같은 자산이 다른 행(다른 OpenWatch ID 나 CSV 로 가져온 행)으로 이미 있거나 묶음 안에서 겹치면 뺌
+
+    row_hash 고유 인덱스 조회 1번. 같은 OpenWatch ID 행의 내용이 그대로면 남겨서 upsert 함
+    """
+    by_hash = {}
+    for asset in assets:
+        by_hash.setdefault(asset.row_hash, asset)
+    owners = dict(Asset.objects.filter(row_hash__in=list(by_hash)).values_list('row_hash', 'openwatch_asset_id'))
+    return [asset for row_hash, asset in by_hash.items()
+            if row_hash not in owners or owners[row_hash] == asset.openwatch_asset_id]
+
+def write_asset_batch(assets): # 자산 정보 묶음을 bulk upsert 로 저장 (openwatch_asset_id 기준, 내용이 같은 다른 행이 있으면 건너뜀)
+    unique_assets = drop_duplicate_assets(assets)
+    created, updated, skipped = bulk_upsert(Asset, unique_assets, 'openwatch_asset_id', ASSET_UPDATE_FIELDS,
+                                            batch_size=max(1, len(unique_assets)))
+    return created, updated, skipped + len(assets) - len(unique_assets)
+
+def moved_members(assets):
+    """이번 upsert 로 다른 의원에게 옮겨질 자산(같은 OpenWatch ID)의 원래 의원 ID (openwatch_asset_id 인덱스 조회 1번)"""
+    new_owners = {asset.openwatch_asset_id: asset.legislator_id for asset in assets}
+    return {
+        legislator_id
+        for openwatch_asset_id, legislator_id in Asset.objects.filter(
+            openwatch_asset_id__in=list(new_owners)
+        ).values_list('openwatch_asset_id', 'legislator_id')
+        if new_owners[openwatch_asset_id] != legislator_id
+    }
+
+def recording_asset_writer(status_file):
+    """write_asset_batch + 자산을 잃은 의원(다른 의원으로 옮겨진 자산의 원래 의원)을 상태 파일에 기록
+
+    저장에 실패하면 예외가 그대로 올라가므로 커밋된 batch 만 기록됨
+    """
+    def write(assets):
+        moved_from = moved_members(assets)
+        result = write_asset_batch(assets)
+        record_changed_members(moved_from, status_file)
+        return result
+    return write
+
+def page_digest(rows): # 페이지 내용 해시 (키 순서와 상관없이 같은 내용이면 같은 값)
+    return hashlib.sha1(json.dumps(rows, sort_keys=True, ensure_ascii=False).encode('utf-8')).hexdigest()
+
+def skip_unchanged_pages(pages, page_hashes, pending_hashes, stats):
+    """지난번과 내용 해시가 같은 페이지는 건너뛰고 바뀐 페이지만 넘겨줌 (incremental 모드)
+
+    바뀐 페이지의 새 해시는 pending_hashes 에만 넣어두고, DB 저장이 끝난 뒤 상태 파일에 기록함.
+    """
+    for page_num, rows in pages:
+        digest = page_digest(rows)
+        if page_hashes.get(str(page_num)) == digest:
+            stats['unchanged_pages'] += 1
+            continue
+        pending_hashes[str(page_num)] = digest
+        yield page_num, rows
+
+def skip_stored_old_rows(assets, marks):
+    """high-water mark 보다 이전 신고분 중 같은 내용(row_hash)이 이미 저장된 행은 뺌 (incremental 모드)
+
+    정정되거나 늦게 올라온 예전 신고분은 row_hash 가 달라서 남음. 예전 신고분이 있을 때만 row_hash 조회 1번
+    """
+    old_hashes = [
+        asset.row_hash for asset in assets
+        if marks.get(asset.legislator_id) and asset.report_year * 100 + asset.report_month < marks[asset.legislator_id]
+    ]
+    if not old_hashes:
+        return assets
+    stored = set(Asset.objects.filter(row_hash__in=old_hashes).values_list('row_hash', flat=True))
+    return [asset for asset in assets if asset.row_hash not in stored]
+
+def report_period(): # 신고 연월을 YYYYMM 정수로 바꾸는 식 (월이 없으면 YYYY00)
+    return F('report_year') * 100 + Coalesce(F('report_month'), 0)
+
+def member_high_water_marks(assets=None): # 의원별 가장 최근 신고 연월 (YYYYMM 정수)
+    assets = Asset.objects.all() if assets is None else assets
+    return dict(
+        assets.order_by().values('legislator_id')
+        .annotate(mark=Max(report_period()))
+        .values_list('legislator_id', 'mark')
+    )
+
+def recompute_total_assets(member_ids=None, batch_size=DEFAULT_BATCH_SIZE):
+    """의원별 최신 신고 연월의 재산 합계(채무, 비영리법인 출연 재산 제외)를 Legislator.total_assets 에 저장
+
+    의원 수와 상관없이 쿼리 몇 번으로 처리함:
+    최신 연월 조회 1번 + 합계 1번 + 현재 값 조회 1번 + bulk_update.
+    member_ids 를 주면 해당 의원만 다시 계산 (자산이 모두 삭제된 의원은 0). 반환값: 값이 바뀐 의원 수
+    """
+    assets = Asset.objects.all()
+    if member_ids is not None:
+        assets = assets.filter(legislator_id__in=member_ids)
+
+    # 1. 의원별 최신 연월
+    marks = member_high_water_marks(assets)
+
+    # 2. 최신 연월 행만 골라 의원별 합계 (의원마다 최신 연월을 상관 서브쿼리로 비교)
+    latest_mark = Asset.objects.filter(legislator_id=OuterRef('legislator_id')).order_by().values(
+        'legislator_id'
+    ).annotate(mark=Max(report_period())).values('mark')
+    totals = dict(
+        assets.order_by()
+        .annotate(period=report_period())
+        .filter(period=Subquery(latest_mark))
+        .exclude(asset_type__in=TOTAL_EXCLUDED_ASSET_TYPES)
+        .values('legislator_id')
+        .annotate(total=Sum('current_valuation'))
+        .values_list('legislator_id', 'total')
+    )
+
+    # 3. 값이 바뀐 의원만 저장 (전체 계산에서는 자산이 하나도 없는 의원은 건드리지 않음)
+    targets = set(marks) if member_ids is None else set(marks) | set(member_ids)
+    current = dict(Legislator.objects.filter(member_id__in=targets).values_list('member_id', 'total_assets'))
+    changed = [
+        Legislator(member_id=member_id, total_assets=totals.get(member_id) or 0)
+        for member_id in current
+        if current[member_id] != (totals.get(member_id) or 0)
+    ]
+    Legislator.objects.bulk_update(changed, ['total_assets'], batch_size=batch_size)
+    return len(changed)
+
+def run_pipeline(pages, parse, write, batch_size=DEFAULT_BATCH_SIZE, label='', on_commit=None):
+    """fetch -> parse -> validate -> batch-write 파이프라인
+
+    pages 는 (페이지 번호, rows) 제너레이터로 받아 batch_size 행 정도씩만 메모리에 올린 뒤 바로 DB에 저장함.
+    (전체 페이지를 리스트에 쌓지 않으므로 페이지 수와 상관없이 메모리 사용량이 일정)
+    batch 는 항상 페이지 단위로 끊기므로, 저장이 끝나면 on_commit(마지막 페이지 번호) 로 체크포인트를 남길 수 있음.
+    저장에 실패한 batch 는 건너뛰고 계속 진행하지만, 그 뒤로는 on_commit 을 부르지 않음
+    (체크포인트가 실패한 페이지를 넘어가면 다음 실행에서 그 페이지를 다시 받지 않음).
+    """
+    saved_count = updated_count = skipped_count = 0
+    processed = 0
+    failed = False
+    for last_page, batch in chunk_pages(pages, batch_size):
+        records = [record for record in map(parse, batch) if record is not None]
+        skipped_count += len(batch) - len(records)
         try:
-            legislator, created = Legislator.objects.update_or_create(
-                member_id=member_id, # 고유 ID 기준으로 찾거나 생성
-                defaults=defaults
-            )
-            if created:
-                saved_count += 1
-            else:
-                updated_count += 1
-        except IntegrityError as e:
-            print(f"Error : DB 무결성 오류 legislator {member_id} ({member_info.get('name')}): {e}")
-            skipped_count += 1
-        except Exception as e:
-            print(f"Error : 의원 정보 저장 {member_id}: {e}")
-            skipped_count += 1
+            saved, updated, skipped = write(records)
+        except Exception as e: # batch 트랜잭션은 롤백됨
+            print(f"Error : {label} batch 저장 실패 ({last_page} 페이지까지): {e}")
+            saved, updated, skipped = 0, 0, len(records)
+            failed = True
+        saved_count += saved
+        updated_count += updated
+        skipped_count += skipped
+        processed += len(batch)
+        if on_commit and not failed:
+            on_commit(last_page)
+        print(f"DB에 {label} 정보 저장 중 {processed}개 처리, {last_page} 페이지까지 완료 (Saved: {saved_count}, Updated: {updated_count}, Skipped: {skipped_count})")
+    return saved_count, updated_count, skipped_count
+
+def resume_page(status_file, key): # 상태 파일에 기록된 다음 페이지 번호 (없으면 1)
+    if not status_file:
+        return 1
+    last_page = load_status(status_file).get(key, 0)
+    if last_page:
+        print(f"상태 파일 {status_file}: {last_page} 페이지까지 저장됨 > {last_page + 1} 페이지부터 이어서 시작")
+    return last_page + 1
+
+def save_legislators(status_file=None, rate_limit=DEFAULT_RATE_LIMIT, batch_size=DEFAULT_BATCH_SIZE): # 의원 정보 저장
+    print("\n의원 정보 저장 시작")
+    start_page = resume_page(status_file, 'legislators_last_page')
+    crawl = {}
+    pages = fetch_pages(MEMBERS_ENDPOINT, limit_param='pageSize', items_per_page=100, rate_limit=rate_limit,
+                        start_page=start_page, result=crawl)
+    saved_count, updated_count, skipped_count = run_pipeline(
+        pages, parse_legislator_item, write_legislator_batch,
+        batch_size=batch_size, label='legislator', on_commit=checkpoint(status_file, 'legislators_last_page')
+    )
+    finish_crawl(status_file, 'legislators_last_page', crawl)
 
     print(f"\nLegislator 정보 저장 완료")
-    print(f"총 받은 양: {total_rows_to_process}, Saved: {saved_count}, Skipped: {skipped_count}")
+    print(f"Saved: {saved_count}, Updated: {updated_count}, Skipped: {skipped_count}")
+    print(f"API 통계: {fetch_stats.summary()}")
     return saved_count, updated_count, skipped_count
 
-def save_assets():  #assets API에서 자산 정보를 가져와 DB에 저장 (파라미터 기반)
-    print("\nAsset 정보 저장 시작")
-
-    # 1. 페이지네이션으로 모든 자산 데이터 가져오기
-    all_asset_items = []
-    page_num = 1
-    items_per_page = 100
-    PARAM_NAME_PAGE = 'page'
-    PARAM_NAME_LIMIT = 'limit'
-    total_count = 0
-
-    while True:
-        # 페이지네이션 API 호출 로직
-        params = { PARAM_NAME_PAGE: page_num, PARAM_NAME_LIMIT: items_per_page }
-        page_data = fetch_api_data(ASSETS_ENDPOINT, params=params)
-        if not page_data: break
-        if page_num == 1:
-            if 'totalCount' in page_data: total_count = page_data['totalCount']
-        items_on_page = page_data.get('rows', [])
-        if not items_on_page: break
-        all_asset_items.extend(items_on_page)
-        if total_count > 0 and len(all_asset_items) >= total_count: break
-        page_num += 1
-        time.sleep(0.5) # 대기 시간 유지
-
-    print(f"\n모든 페이지 가져오기 끝 / 총 asset 양 : {len(all_asset_items)}")
-
-    # 2. DB 저장을 위한 준비
-    saved_count = 0
-    updated_count = 0
+def write_assets_to_csv(pages, output_file_path, append=False, batch_size=DEFAULT_BATCH_SIZE, on_commit=None):
+    """DB 대신 API 원본 행을 CSV 로 저장 (--output-file). 반환값: (0, 0, id 없어서 건너뛴 행 수)"""
     skipped_count = 0
-    total_rows_to_process = len(all_asset_items)
-
-    if total_rows_to_process == 0:
-        print("DB에 저장할 asset 정보가 없음")
-        return 0, 0, 0
+    with open(output_file_path, 'a' if append else 'w', newline='', encoding='utf-8-sig') as f:
+        writer = csv.writer(f)
+        if not append:
+            writer.writerow(OUTPUT_FILE_COLUMNS)
+        for last_page, batch in chunk_pages(pages, batch_size):
+            for item in batch:
+                if not item.get('id'):
+                    skipped_count += 1
+                    continue
+                writer.writerow([
+                    item.get('id'), item.get('nationalAssemblyMemberId'), item.get('date'), item.get('type'),
+                    item.get('kind'), item.get('relation'), item.get('detail'),
+                    item.get('currentValutaion') or item.get('currentValuation'), item.get('originValuation'),
+                    item.get('increasedAmount'), item.get('decreasedAmount'), item.get('reason'),
+                ])
+            f.flush()
+            os.fsync(f.fileno())
+            if on_commit:
+                on_commit(last_page)
+            print(f"{output_file_path} 에 {last_page} 페이지까지 저장")
+    return 0, 0, skipped_count
+
+def save_assets(max_pages=0, output_file_path=None, status_file=None, concurrency=DEFAULT_CONCURRENCY,
+                rate_limit=DEFAULT_RATE_LIMIT, batch_size=DEFAULT_BATCH_SIZE, incremental=False):  #assets API에서 자산 정보를 가져와 DB에 저장 (파라미터 기반)
+    print("\nAsset 정보 저장 시작")
+    if incremental and not output_file_path:
+        return sync_assets_incremental(max_pages=max_pages, status_file=status_file, concurrency=concurrency,
+                                       rate_limit=rate_limit, batch_size=batch_size)
+
+    # 파일 출력 모드는 DB 모드와 진행 상황을 따로 기록 (파일로 받은 페이지를 DB 에서 건너뛰지 않도록)
+    status_key = 'assets_output_last_page' if output_file_path else 'assets_last_page'
+    start_page = resume_page(status_file, status_key)
+    crawl = {}
+    pages = fetch_pages(ASSETS_ENDPOINT, limit_param='limit', items_per_page=100, concurrency=concurrency,
+                        rate_limit=rate_limit, max_pages=max_pages, start_page=start_page, result=crawl)
+
+    if output_file_path:
+        append = start_page > 1 and os.path.exists(output_file_path)
+        result = write_assets_to_csv(pages, output_file_path, append=append, batch_size=batch_size,
+                                     on_commit=checkpoint(status_file, status_key))
+        finish_crawl(status_file, status_key, crawl)
+        print(f"API 통계: {fetch_stats.summary()}")
+        return result
 
     # member_id를 키로, Legislator 객체를 값으로 하는 딕셔너리 생성
     try:
@@ -168,71 +720,78 @@ def save_assets():  #assets API에서 자산 정보를 가져와 DB에 저장 (
 
     except Exception as e:
         print(f"Error: legislators 로딩: {e}.")
-        return 0, 0, total_rows_to_process # 오류 발생 시 중단 및 스킵 처리
-
-    print(f"asset 정보 프로세스 시작: {total_rows_to_process}")
-
-    # 3. 모든 자산 데이터를 순회하며 DB에 저장
-    for i, item in enumerate(all_asset_items):
-        if (i + 1) % 500 == 0: # 500개마다 로그 출력
-             print(f"DB에 저장 중 {i+1} / {total_rows_to_process}...")
+        return 0, 0, 0 # 오류 발생 시 중단
 
-        # 기존 자산 정보 추출
-        openwatch_asset_id = item.get('id')
-        national_assembly_member_id = item.get('nationalAssemblyMemberId')
-        date_str = item.get('date')
-
-        if not openwatch_asset_id or not national_assembly_member_id or not date_str:
-            skipped_count += 1
-            continue
-        legislator = legislators_dict.get(national_assembly_member_id) # 딕셔너리에서 조회
-        if legislator is None:
-            # 미리 로드한 딕셔너리에 해당 의원이 없으면 건너뛰기
-            skipped_count += 1
-            continue
-
-        try:
-            # Asset 모델에 parse_date_string 메소드가 있다고 가정
-            report_year, report_month = Asset.parse_date_string(date_str)
-            if report_year is None or report_month is None:
-                skipped_count += 1
-                continue
-        except AttributeError:
-             print(f"Error: Asset have not 'parse_date_string")
-             skipped_count += 1
-             continue
-        except Exception as e:
-             print(f"Error: 날짜 오류 '{date_str}': {e}")
-             skipped_count += 1
-             continue
-
-        defaults = {
-            'legislator': legislator,
-            'report_year': report_year,
-            'report_month': report_month,
-            'current_valuation': item.get('currentValutaion') or item.get('currentValuation'),
-        }
-        defaults = {k: v for k, v in defaults.items() if v is not None}
-
-        try:
-            asset, created = Asset.objects.update_or_create(
-                openwatch_asset_id=openwatch_asset_id,
-                defaults=defaults
-            )
-            if created:
-                saved_count += 1
-            else:
-                updated_count += 1
-        except Exception as e:
-            # 오류 처리
-            skipped_count += 1
+    # 페이지를 받는 대로 파싱해서 batch_size 개씩 저장 (concurrency > 1 이면 동시 요청)
+    saved_count, updated_count, skipped_count = run_pipeline(
+        pages, lambda item: parse_asset_item(item, legislators_dict), recording_asset_writer(status_file),
+        batch_size=batch_size, label='asset', on_commit=checkpoint(status_file, status_key)
+    )
+    finish_crawl(status_file, status_key, crawl)
 
     print(f"\n문제 없이 끝")
-    print(f"총 받은 양: {total_rows_to_process}, Saved: {saved_count}, Skipped: {skipped_count}")
+    print(f"Saved: {saved_count}, Updated: {updated_count}, Skipped: {skipped_count}")
+    print(f"API 통계: {fetch_stats.summary()}")
+    return saved_count, updated_count, skipped_count
+
+def sync_assets_incremental(max_pages=0, status_file=None, concurrency=DEFAULT_CONCURRENCY,
+                            rate_limit=DEFAULT_RATE_LIMIT, batch_size=DEFAULT_BATCH_SIZE):
+    """incremental 모드: 바뀐 데이터만 DB 에 반영
+
+    - 지난 실행 때와 내용 해시가 같은 페이지는 파싱/DB 저장 없이 건너뜀 (상태 파일의 assets_page_hashes)
+    - 바뀐 페이지는 openwatch_asset_id / row_hash upsert 로 새 행과 정정된 행을 저장
+      (의원별 최근 신고 연월(high-water mark)보다 이전 신고분은 같은 내용(row_hash)이 이미 있을 때만 건너뜀)
+    OpenWatch API 에 변경분 조회 파라미터가 없으므로 페이지 요청은 처음부터 끝까지 함.
+    반환값의 saved 가 실제로 새로 추가된 행 수.
+    """
+    print("incremental 모드: 바뀐 페이지와 새 신고분만 저장")
+    status = load_status(status_file) if status_file else {}
+    page_hashes = status.get('assets_page_hashes', {})
+    pending_hashes = {}
+    stats = {'unchanged_pages': 0, 'old_rows': 0}
+
+    legislators_dict = {leg.member_id: leg for leg in Legislator.objects.all()}
+    marks = member_high_water_marks()
+    print(f"Loaded {len(legislators_dict)} legislators, 기록된 페이지 해시 {len(page_hashes)}개")
+
+    write_assets = recording_asset_writer(status_file)
+
+    def write(assets):
+        new_assets = skip_stored_old_rows(assets, marks)
+        stats['old_rows'] += len(assets) - len(new_assets)
+        created, updated, skipped = write_assets(new_assets)
+        return created, updated, skipped + len(assets) - len(new_assets)
+
+    def on_commit(last_page):
+        """저장(커밋)이 끝난 batch 의 페이지 해시만 기록
+
+        run_pipeline 은 저장에 실패한 batch 가 있으면 그 뒤로 on_commit 을 부르지 않으므로
+        실패한 페이지의 해시는 기록되지 않고, 다음 실행에서 바뀐 페이지로 보고 다시 저장함.
+        """
+        committed = {page: pending_hashes.pop(page) for page in list(pending_hashes) if int(page) <= last_page}
+        if not status_file:
+            return
+        status = load_status(status_file)
+        status.setdefault('assets_page_hashes', {}).update(committed)
+        save_status(status, status_file)
+
+    pages = fetch_pages(ASSETS_ENDPOINT, limit_param='limit', items_per_page=100, concurrency=concurrency,
+                        rate_limit=rate_limit, max_pages=max_pages)
+    saved_count, updated_count, skipped_count = run_pipeline(
+        skip_unchanged_pages(pages, page_hashes, pending_hashes, stats),
+        lambda item: parse_asset_item(item, legislators_dict), write,
+        batch_size=batch_size, label='asset', on_commit=on_commit
+    )
+    skipped_count -= stats['old_rows']
+
+    print(f"\nincremental 동기화 끝")
+    print(f"새로 추가: {saved_count}, Updated: {updated_count}, Skipped: {skipped_count}, "
+          f"변경 없는 페이지: {stats['unchanged_pages']}, 예전 신고분: {stats['old_rows']}")
+    print(f"API 통계: {fetch_stats.summary()}")
     return saved_count, updated_count, skipped_count
 
 def run_import_process():
     print("프로그램 실행")
-    save_legislators() # 의원 신상 정보 저장
-    save_assets() # 자산 정보 저장
+    save_legislators(status_file=DEFAULT_STATUS_FILE) # 의원 신상 정보 저장
+    save_assets(status_file=DEFAULT_STATUS_FILE) # 자산 정보 저장
     print("\문제 없이 끝")
\ No newline at end of file
@@ -1,96 +1,58 @@
 from django.shortcuts import render, get_object_or_404
-from django.core.paginator import Paginator
 from ow.models import Legislator, Asset
+from ow.dashboard import get_dashboard_data
+from ow.cache import cached_view
+from ow.pagination import KeysetPaginator
+from ow.search import search_legislators, autocomplete
+from django.http import JsonResponse
 from django.db.models import Sum
-from collections import defaultdict
-from django.db.models.functions import Left
+from django.db.models.functions import Coalesce
 
+# member_info 재산 내역 표에 출력하는 컬럼
+ASSET_TABLE_FIELDS = ['report_year', 'report_month', 'asset_type', 'relation', 'kind', 'detail',
+                      'origin_valuation', 'increased_amount', 'decreased_amount', 'current_valuation', 'reason_for_change']
+
+def page_query(request): # 현재 쿼리스트링에서 page/cursor 를 뺀 것 (페이지 링크용)
+    params = request.GET.copy()
+    params.pop('page', None)
+    params.pop('cursor', None)
+    return params.urlencode()
+
+@cached_view
 def main_page(request): # 모든 데이터는 22대로 제한
-    # 재산 총에 기준으로 내림차순 정렬하여 상위 의원 20명 슬라이싱
-    top_members = Legislator.objects.filter(latest_age__contains='22대').order_by('-total_assets')[:20]
+    # 집계는 import 때 미리 계산해둔 스냅샷에서 읽음 (ow/dashboard.py)
+    dashboard = get_dashboard_data()
 
-    # 순위 붙이기 (각 항목은 순위, Legislator 객체로 구성된 딕셔너리)
-    numbered_members = [ 
+    # 순위 붙이기 (각 항목은 순위, 의원 정보 딕셔너리로 구성된 딕셔너리)
+    numbered_members = [
         {'rank': idx + 1, 'member': member}
-        for idx, member in enumerate(top_members)
+        for idx, member in enumerate(dashboard['top_members'])
     ]
 
     # 4개씩 나누기 -> 4개씩 한 화면에 출력하기 위함
     chunked_members = [numbered_members[i:i+4] for i in range(0, len(numbered_members), 4)]
 
-    # 지역별 자산 합계 (지역 앞 2글자 기준)
-    assets_by_region_qs = Legislator.objects.filter(
-        latest_age__contains='22대'
-    ).exclude(
-        electoral_district__isnull=True
-    ).exclude(
-        electoral_district__startswith='비례' # 비례대표는 제외
-    ).annotate(
-        short_region=Left('electoral_district', 2)
-    ).values('short_region').annotate( # 지역에 해당하는 의원들의 재산 총액을 모두 더함
-        total_assets=Sum('total_assets')
-    )
-    
-    # 지역 : 총액으로 이루어진 딕셔너리
-    region_assets = {item['short_region']: item['total_assets'] for item in assets_by_region_qs}
-    # 키, 값을 각각 리스트로 나눠서 전달(차트용)
-    regions = list(region_assets.keys())
-    region_asset_values = list(region_assets.values())
-
-    # 정당별 자산 합계
-    assets_by_party_qs = Legislator.objects.filter(
-        latest_age__contains='22대'
-    ).exclude(party__isnull=True).values('party').annotate(
-        total_assets=Sum('total_assets')
-    )
-    # 정당 : 총액으로 이루어진 딕셔너리
-    party_assets = {item['party']: item['total_assets'] for item in assets_by_party_qs}
-    # 키, 값을 각각 리스트로 나눠서 전달(차트용)
-    parties = list(party_assets.keys())
-    party_asset_values = list(party_assets.values())
-
-    # 지역별 상위 5명
-    region_top5_data = {}
-    for region in regions:
-        top5 = Legislator.objects.filter(
-            latest_age__contains='22대',
-            electoral_district__startswith=region # 지역에 해당하는 의원 필터
-        ).order_by('-total_assets')[:5] # 상위 5명까지만 저장
-        region_top5_data[region] = [
-            # 이름, 재산총액, 의원 id(id는 카드 클릭 시 페이지 이동을 위해 필요)를 담은 딕셔너리를 각 지역에(키) 해당하는 값으로 저장 
-            {'name': m.name, 'total_assets': m.total_assets or 0, 'member_id': m.member_id}
-            for m in top5
-        ]
-
-    # 정당별 상위 5명
-    party_top5_data = {}
-    for party in parties:
-        top5 = Legislator.objects.filter(
-            latest_age__contains='22대',
-            party=party # 정당에 해당하는 의원 필터
-        ).order_by('-total_assets')[:5] # 상위 5명까지만 저장
-        party_top5_data[party] = [
-            # 이름, 재산총액, 의원 id(id는 카드 클릭 시 페이지 이동을 위해 필요)를 담은 딕셔너리를 각 정당에(키) 해당하는 값으로 저장 
-            {'name': m.name, 'total_assets': m.total_assets or 0, 'member_id': m.member_id}
-            for m in top5
-        ]
+    # 지역/정당 : 총액으로 이루어진 딕셔너리
+    region_assets = dashboard['region_assets']
+    party_assets = dashboard['party_assets']
 
     return render(request, 'main_page.html', {
         'chunked_members': chunked_members, # 상위 20위 슬라이더를 위해 4명씩 자른 리스트
         'region_assets': region_assets, # 지역별 총 재산을 담은 딕셔너리
         'party_assets': party_assets, # 정당별 총 재산을 담은 딕셔너리
-        'region_top5': region_top5_data, # 지역별 재산 상위 5위 의원 딕셔너리
-        'party_top5': party_top5_data, # 정당별 재산 상위 5위 의원 딕셔너리
+        'region_top5': dashboard['region_top5'], # 지역별 재산 상위 5위 의원 딕셔너리
+        'party_top5': dashboard['party_top5'], # 정당별 재산 상위 5위 의원 딕셔너리
         
         # 아래 리스트들은 차트를 만들기 위해 따로 제공하는 것
-        'regions': regions, # 선택 가능한 지역을 담은 리스트
-        'parties': parties, # 선택 가능한 정당을 담은 리스트
-        'party_asset_values': party_asset_values, # 지역의 재산 총액을 담은 리스트
-        'region_asset_values': region_asset_values, # 정당의 재산 총액을 담은 리스트
+        'regions': list(region_assets.keys()), # 선택 가능한 지역을 담은 리스트
+        'parties': list(party_assets.keys()), # 선택 가능한 정당을 담은 리스트
+        'party_asset_values': list(party_assets.values()), # 지역의 재산 총액을 담은 리스트
+        'region_asset_values': list(region_assets.values()), # 정당의 재산 총액을 담은 리스트
     })
 
 
 
+@cached_view
 def member_list(request):  # 의원 목록 페이지
     order_by = request.GET.get('order_by', 'name')  # 기본 정렬: 이름
     query = request.GET.get('q', '')  # 검색어 파라미터
@@ -103,29 +65,27 @@ def member_list(request):  # 의원 목록 페이지
     members = Legislator.objects.all()
 
     if query:
-        members = members.filter(name__icontains=query)  # 이름 기준 검색
+        members = search_legislators(query, members)  # 이름/한자/정당/선거구 검색, 초성 검색 (ow/search.py)
     if party:
         members = members.filter(party=party) # 정당 필터
     if region:
-        members = members.filter(electoral_district__startswith=region) # 지역 필터
+        members = members.filter(region=region) # 지역 필터
 
-    # 정렬 기준 처리
-    if order_by in ['name', '-total_assets']: # 이름순, 재산순
-        members = members.order_by(order_by)
+    # 정렬 기준 처리 (member_id 는 동점 처리용, 커서 페이지네이션에 필요)
+    if order_by == '-total_assets': # 재산순
+        ordering = ['-total_assets', 'member_id']
     else:
-        members = members.order_by('name')  # 기본값
+        ordering = ['name', 'member_id']  # 이름순 (기본값)
 
     # 필터용 데이터 (드롭박스)
     parties = Legislator.objects.exclude(party__isnull=True).exclude(party='').values_list('party', flat=True).distinct()
-    districts = Legislator.objects.exclude(electoral_district__isnull=True).exclude(electoral_district='')\
-        .values_list('electoral_district', flat=True)
-    regions = sorted({d.split()[0] for d in districts if ' ' in d})  # 첫 단어 기준
+    regions = Legislator.objects.exclude(region__isnull=True).order_by('region')\
+        .values_list('region', flat=True).distinct()  # 선거구 첫 단어 (미리 계산된 region 컬럼)
 
-    # 페이지네이션
-    paginator = Paginator(members, 20) # 한 페이지에 20명
-    page_number = request.GET.get('page') # 현재 페이지 번호
+    # 페이지네이션 (이전/다음은 커서, 번호 클릭은 페이지 번호)
+    paginator = KeysetPaginator(members, 20, ordering) # 한 페이지에 20명
+    page_obj = paginator.get_page(request.GET.get('page'), request.GET.get('cursor'))
     # 10 페이지 범위 단위 구성
-    page_obj = paginator.get_page(page_number)
     current_page = page_obj.number
     page_start = ((current_page - 1) // 10) * 10 + 1 
     page_end = min(page_start + 9, page_obj.paginator.num_pages)
@@ -138,35 +98,36 @@ def member_list(request):  # 의원 목록 페이지
         'page_obj': page_obj, # 현재 페이지의 데이터 목록
         'page_range': page_range, # 페이지 개수 체크를 위함
         'query': query, # 검색용
+        'page_query': page_query(request), # 페이지 링크에 붙일 필터/정렬 파라미터
     })
 
 
+@cached_view
 def member_info(request, member_id): # 의원 상세 정보 페이지
     # 해당 의원 id를 가진 의원 데이터를 가져옴 (존재하지 않는 경우 404 페이지)
     member = get_object_or_404(Legislator, member_id=member_id) 
-    # 그 의원의 재산 내역을 가져옴
-    asset = Asset.objects.filter(legislator=member).order_by('-report_year', '-report_month')
-    # 한 페이지에 10명씩 담음
-    paginator = Paginator(asset, 10)
-
-    # 연월별 자산 합계 계산 (재산 변화 그래프용)
-    assets_by_month = defaultdict(int) # 연월 : 총액 형태의 딕셔너리
-    for asset in asset:
-        # 해당 연월의 재산 내역을 모두 합산
-        if asset.report_year and asset.report_month:
-            key = f"{asset.report_year}-{asset.report_month:02d}"
-            assets_by_month[key] += asset.current_valuation or 0
-
-    # 날짜 오름차순 정렬 (그래프 테이블을 위함)
-    assets_by_month = dict(sorted(assets_by_month.items()))
-    
-    # 정렬된 딕셔너리를 리스트 2개로 분리 (그래프용)
-    labels = sorted(assets_by_month.keys())
-    values = [assets_by_month[key] for key in labels]
+    # 그 의원의 재산 내역을 가져옴 (표에 보여주는 컬럼만)
+    asset = Asset.objects.filter(legislator=member).only(*ASSET_TABLE_FIELDS)
+    # 한 페이지에 10개씩 담음 (최신순, id 는 동점 처리용)
+    paginator = KeysetPaginator(asset, 10, ['-report_year', '-report_month', 'id'])
+
+    # 연월별 자산 합계 계산 (재산 변화 그래프용) -> DB 에서 GROUP BY 로 합산
+    monthly_totals = (
+        Asset.objects.filter(legislator=member, report_year__gt=0, report_month__gt=0)
+        .values('report_year', 'report_month')
+        .annotate(total=Coalesce(Sum('current_valuation'), 0))
+        .order_by('report_year', 'report_month') # 날짜 오름차순 (그래프용)
+    )
+
+    # 결과를 리스트 2개로 분리 (그래프용)
+    labels = []
+    values = []
+    for row in monthly_totals:
+        labels.append(f"{row['report_year']}-{row['report_month']:02d}")
+        values.append(row['total'])
     
-    # 페이지네이션
-    page_number = request.GET.get('page') # 현재 페이지 번호
-    page_obj = paginator.get_page(page_number)
+    # 페이지네이션 (이전/다음은 커서, 번호 클릭은 페이지 번호)
+    page_obj = paginator.get_page(request.GET.get('page'), request.GET.get('cursor'))
     # 10 페이지 범위 단위 구성
     current_page = page_obj.number 
     page_start = ((current_page - 1) // 10) * 10 + 1
@@ -181,6 +142,10 @@ def member_info(request, member_id): # 의원 상세 정보 페이지
         'graph_data': values, # 그래프 y축 (금액)
     })
 
+@cached_view
+def member_autocomplete(request): # 검색창 자동완성 (JSON)
+    return JsonResponse({'results': autocomplete(request.GET.get('q', ''))})
+
 def api_page(request): # api 정보 페이지
     return render(request, 'api_page.html')
 